@@ -1,5 +1,6 @@
 """Chat dependencies for FastAPI routes."""
 
+from functools import lru_cache
 from typing import Annotated
 from fastapi import Depends
 from app.application.use_cases.chat_uc import ChatUseCase
@@ -13,8 +14,15 @@ from app.infrastructure.adapters.resources.notion_repo import NotionTokenRepo
 from app.infrastructure.config.config import get_settings
 
 
+@lru_cache
 def get_azure_openai_adapter() -> AzureOpenAIAdapter:
-    """Get Azure OpenAI Adapter instance."""
+    """Get the process-wide Azure OpenAI Adapter instance.
+
+    Memoized: the adapter pre-warms its default LLM and keeps an
+    instance-level LLM cache, both of which would be thrown away after
+    every request if a fresh adapter were built per dependency
+    resolution. Its shared HTTP pools are closed from the lifespan.
+    """
     settings = get_settings()
     return AzureOpenAIAdapter(
         azure_endpoint=settings.azure_openai_endpoint,
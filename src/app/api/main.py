@@ -10,6 +10,9 @@ from app.api.routes.notion_route import router as notion_router
 from app.api.routes.google_route import router as google_router
 from app.api.routes.canvas_route import router as canvas_router
 from app.api.routes.chat_route import router as chat_router
+from app.api.dependencies.chat_dep import get_azure_openai_adapter
+from app.application.services.google_service import GoogleService
+from app.infrastructure.adapters.azure.aoai_adapter import AzureOpenAIAdapter
 from app.infrastructure.config.db import Database
 from app.infrastructure.config.config import get_settings
 
@@ -25,7 +28,11 @@ async def lifespan(app: FastAPI):  # pylint: disable=unused-argument
     await Database.connect_db(
         mongodb_uri=settings.mongodb_uri, db_name=settings.mongodb_db_name
     )
+    # Build (and pre-warm) the shared LLM adapter before the first request.
+    get_azure_openai_adapter()
     yield
+    await AzureOpenAIAdapter.aclose()
+    await GoogleService.close_http_client()
     await Database.close_db()
     _logger.info("Application lifespan ended: database connection closed")
 
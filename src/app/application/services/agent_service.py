@@ -5,7 +5,12 @@ import logging
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 from beanie import PydanticObjectId
-from app.domain.db.models.chat import ChatSessionModel, MessageModel
+from app.domain.db.models.chat import (
+    ChatSessionModel,
+    MessageHistoryProjection,
+    MessageModel,
+    SessionSummaryProjection,
+)
 from app.domain.tools.canvas import create_canvas_tools
 from app.domain.tools.google_calendar_tools import create_google_calendar_tools
 from app.domain.tools.notion_tools import create_notion_tools
@@ -155,7 +160,6 @@ class AgentService:
             role="user",
             content=message,
         )
-        await user_msg.save()
 
         tools = await self.get_user_tools(user_id, canvas_token, canvas_base_url)
 
@@ -164,6 +168,7 @@ class AgentService:
         if not system_prompt:
             system_prompt = self._get_default_system_prompt(tools)
 
+        user_persisted = False
         try:
             response = self.azure_openai.chat_completion(
                 messages=messages, tools=tools, system_prompt=system_prompt
@@ -179,13 +184,18 @@ class AgentService:
                 content=assistant_content,
                 metadata=metadata,
             )
-            await assistant_msg.save()
-
-            session.message_count += 2
-            session.last_message_at = datetime.now(timezone.utc)
+            await MessageModel.insert_many([user_msg, assistant_msg], ordered=False)
+            user_persisted = True
+
+            now = datetime.now(timezone.utc)
+            session_update: Dict[str, Any] = {
+                "$inc": {"message_count": 2},
+                "$max": {"last_message_at": now},
+                "$set": {"updated_at": now},
+            }
 
-            if not session.title and session.message_count == 2:
-                session.title = await self._generate_session_title(
+            if not session.title and session.message_count == 0:
+                session_update["$set"]["title"] = await self._generate_session_title(
                     message,
                     history
                     + [
@@ -194,7 +204,7 @@ class AgentService:
                     ],
                 )
 
-            await session.save()
+            await session.update(session_update)
 
             return {
                 "session_id": session_id,
@@ -205,6 +215,13 @@ class AgentService:
 
         except Exception as e:
             _logger.error("Agent error: %s", e)
+            if not user_persisted:
+                # The batched insert never ran; keep the user's message in
+                # history even though the agent call failed.
+                try:
+                    await user_msg.save()
+                except Exception as save_error:
+                    _logger.error("Failed to persist user message: %s", save_error)
             raise
 
     async def _load_canvas_tools(self, user_id: str) -> List:
@@ -241,6 +258,7 @@ class AgentService:
             await MessageModel.find(MessageModel.session_id == session_id)
             .sort("-created_at")
             .limit(limit)
+            .project(MessageHistoryProjection)
             .to_list()
         )
 
@@ -391,6 +409,7 @@ class AgentService:
                 )
                 .sort("-last_message_at")
                 .limit(limit)
+                .project(SessionSummaryProjection)
                 .to_list()
             )
         else:
@@ -400,6 +419,7 @@ class AgentService:
                 )
                 .sort("-last_message_at")
                 .limit(limit)
+                .project(SessionSummaryProjection)
                 .to_list()
             )
 
@@ -442,6 +462,7 @@ class AgentService:
             await MessageModel.find(MessageModel.session_id == session_id)
             .sort("+created_at")
             .limit(limit)
+            .project(MessageHistoryProjection)
             .to_list()
         )
 
@@ -455,6 +476,29 @@ class AgentService:
             for msg in messages
         ]
 
+    async def stream_session_messages(self, session_id: str):
+        """Stream all messages of a session as raw dicts.
+
+        Uses a batched motor cursor instead of materializing the whole
+        history with ``to_list``, so peak memory stays bounded no matter
+        how long the session is. Intended for consumers that need the
+        full history (e.g., summarization).
+
+        Args:
+            session_id: Session ID
+
+        Yields:
+            Message documents as dicts, oldest first
+        """
+        cursor = (
+            MessageModel.get_motor_collection()
+            .find({"session_id": session_id})
+            .sort("created_at", 1)
+            .batch_size(500)
+        )
+        async for doc in cursor:
+            yield doc
+
     async def delete_session(self, session_id: str, user_id: str) -> bool:
         """Delete (archive) a chat session.
         Args:
@@ -550,7 +594,6 @@ class AgentService:
             role="user",
             content=message,
         )
-        await user_msg.save()
 
         tools = await self.get_user_tools(user_id, canvas_token, canvas_base_url)
 
@@ -559,6 +602,7 @@ class AgentService:
         if not system_prompt:
             system_prompt = self._get_default_system_prompt(tools)
 
+        user_persisted = False
         try:
             response = await self.azure_openai.chat_completion_stream(
                 messages=messages,
@@ -577,13 +621,18 @@ class AgentService:
                 content=assistant_content,
                 metadata=metadata,
             )
-            await assistant_msg.save()
-
-            session.message_count += 2
-            session.last_message_at = datetime.now(timezone.utc)
+            await MessageModel.insert_many([user_msg, assistant_msg], ordered=False)
+            user_persisted = True
+
+            now = datetime.now(timezone.utc)
+            session_update: Dict[str, Any] = {
+                "$inc": {"message_count": 2},
+                "$max": {"last_message_at": now},
+                "$set": {"updated_at": now},
+            }
 
-            if not session.title and session.message_count == 2:
-                session.title = await self._generate_session_title(
+            if not session.title and session.message_count == 0:
+                session_update["$set"]["title"] = await self._generate_session_title(
                     message,
                     history
                     + [
@@ -592,8 +641,15 @@ class AgentService:
                     ],
                 )
 
-            await session.save()
+            await session.update(session_update)
 
         except Exception as e:
             _logger.error("Agent streaming error: %s", e, exc_info=True)
+            if not user_persisted:
+                # The batched insert never ran; keep the user's message in
+                # history even though the agent call failed.
+                try:
+                    await user_msg.save()
+                except Exception as save_error:
+                    _logger.error("Failed to persist user message: %s", save_error)
             raise
@@ -87,6 +87,21 @@ class ChatUseCase:
             limit=limit,
         )
 
+    def stream_session_messages(self, session_id: str):
+        """Stream every message of a session as raw dicts.
+
+        Unlike get_session_history this has no limit; messages are pulled
+        through a batched cursor so memory stays bounded for very long
+        sessions.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Async generator yielding message dicts, oldest first
+        """
+        return self.agent_service.stream_session_messages(session_id)
+
     async def delete_session(self, session_id: str, user_id: str) -> bool:
         """Delete (archive) a chat session.
 
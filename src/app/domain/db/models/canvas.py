@@ -2,7 +2,7 @@
 
 from typing import Optional
 from beanie import Document
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 
 class CanvasTokenModel(Document):
@@ -14,14 +14,10 @@ class CanvasTokenModel(Document):
     canvas_user_id: Optional[str] = None
     canvas_user_name: Optional[str] = None
 
-    class Settings:
-        name = "canvas_tokens"
-        indexes = [
-            "user_id",
-        ]
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        validate_assignment=False,
+        str_strip_whitespace=False,
+        json_schema_extra={
             "example": {
                 "user_id": "user_123",
                 "canvas_base_url": "https://canvas.instructure.com",
@@ -29,4 +25,11 @@ class CanvasTokenModel(Document):
                 "canvas_user_id": "123456",
                 "canvas_user_name": "John Doe",
             }
-        }
+        },
+    )
+
+    class Settings:
+        name = "canvas_tokens"
+        indexes = [
+            "user_id",
+        ]
@@ -2,8 +2,9 @@
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from beanie import Document
-from pydantic import Field
+import pymongo
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MessageModel(Document):
@@ -18,6 +19,20 @@ class MessageModel(Document):
     metadata: Optional[Dict[str, Any]] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    model_config = ConfigDict(
+        validate_assignment=False,
+        str_strip_whitespace=False,
+        json_schema_extra={
+            "example": {
+                "session_id": "session_123",
+                "user_id": "user_456",
+                "role": "user",
+                "content": "What are my current courses?",
+                "created_at": "2026-01-25T10:30:00Z",
+            }
+        },
+    )
+
     class Settings:
         """Beanie settings for MessageModel."""
 
@@ -28,16 +43,32 @@ class MessageModel(Document):
             "created_at",
         ]
 
-    class Config:  # pylint: disable=missing-class-docstring
-        json_schema_extra = {
-            "example": {
-                "session_id": "session_123",
-                "user_id": "user_456",
-                "role": "user",
-                "content": "What are my current courses?",
-                "created_at": "2026-01-25T10:30:00Z",
-            }
-        }
+
+class SessionSummaryProjection(BaseModel):
+    """Projection of ChatSessionModel for session list endpoints.
+
+    Only the fields the sidebar shows — skips ``metadata`` and the rest of
+    the document both on the wire and in Pydantic validation.
+    """
+
+    id: PydanticObjectId = Field(alias="_id")
+    title: Optional[str] = None
+    message_count: int = 0
+    last_message_at: Optional[datetime] = None
+    created_at: datetime
+
+
+class MessageHistoryProjection(BaseModel):
+    """Read-only projection of MessageModel for history retrieval.
+
+    Excludes ``tool_calls`` and other heavy fields so history reads don't
+    pay for Pydantic walking arbitrary nested JSON on every document.
+    """
+
+    role: str
+    content: str
+    metadata: Optional[Dict[str, Any]] = None
+    created_at: datetime
 
 
 class ChatSessionModel(Document):
@@ -52,6 +83,21 @@ class ChatSessionModel(Document):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = None
 
+    model_config = ConfigDict(
+        validate_assignment=False,
+        str_strip_whitespace=False,
+        json_schema_extra={
+            "example": {
+                "user_id": "user_456",
+                "title": "Course Questions",
+                "message_count": 5,
+                "last_message_at": "2026-01-25T10:35:00Z",
+                "is_active": True,
+                "created_at": "2026-01-25T10:30:00Z",
+            }
+        },
+    )
+
     class Settings:
         """Beanie settings for ChatSessionModel."""
 
@@ -61,16 +107,11 @@ class ChatSessionModel(Document):
             "created_at",
             "last_message_at",
             "is_active",
+            # Backs the "list sessions" sidebar query (filter on user/active,
+            # sort by most recent) with a single index scan.
+            [
+                ("user_id", pymongo.ASCENDING),
+                ("is_active", pymongo.ASCENDING),
+                ("last_message_at", pymongo.DESCENDING),
+            ],
         ]
-
-    class Config:  # pylint: disable=missing-class-docstring
-        json_schema_extra = {
-            "example": {
-                "user_id": "user_456",
-                "title": "Course Questions",
-                "message_count": 5,
-                "last_message_at": "2026-01-25T10:35:00Z",
-                "is_active": True,
-                "created_at": "2026-01-25T10:30:00Z",
-            }
-        }
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 from beanie import Document
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 
 class GoogleTokenModel(Document):
@@ -24,6 +24,11 @@ class GoogleTokenModel(Document):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    model_config = ConfigDict(
+        validate_assignment=False,
+        str_strip_whitespace=False,
+    )
+
     class Settings:
         """Beanie settings"""
 
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 from beanie import Document
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 
 class NotionTokenModel(Document):
@@ -22,6 +22,11 @@ class NotionTokenModel(Document):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    model_config = ConfigDict(
+        validate_assignment=False,
+        str_strip_whitespace=False,
+    )
+
     class Settings:
         """Beanie settings"""
 
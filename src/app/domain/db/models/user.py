@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 from beanie import Document
-from pydantic import EmailStr, Field
+from pydantic import ConfigDict, EmailStr, Field
 
 
 class UserModel(Document):
@@ -16,12 +16,10 @@ class UserModel(Document):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = None
 
-    class Settings:  # pylint: disable=missing-class-docstring
-        name = "users"
-        indexes = ["email"]
-
-    class Config:  # pylint: disable=missing-class-docstring
-        json_schema_extra = {
+    model_config = ConfigDict(
+        validate_assignment=False,
+        str_strip_whitespace=False,
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "full_name": "John Doe",
@@ -29,4 +27,9 @@ class UserModel(Document):
                 "is_active": True,
                 "is_superuser": False,
             }
-        }
+        },
+    )
+
+    class Settings:  # pylint: disable=missing-class-docstring
+        name = "users"
+        indexes = ["email"]
@@ -1,15 +1,36 @@
 """Canvas LMS tools package."""
 
+from cachetools import TTLCache
+
 from .base import CanvasToolsHelper
 from .core_tools import create_core_tools
 from .assignment_tools import create_assignment_tools
 from .grade_tools import create_grade_tools
 from .analysis_tools import create_analysis_tools
 
+# Tool lists are rebuilt on every chat turn, and each rebuild re-runs the
+# @tool decorator (docstring parse + argument-schema inference) for every
+# closure. Reusing the list per Canvas credentials skips all of that and
+# keeps the helper's TTL caches warm across turns.
+_TOOLS_CACHE: TTLCache = TTLCache(maxsize=256, ttl=300)
+
 
 def create_canvas_tools(canvas_repo, google_calendar_helper=None) -> list:
     """Create all Canvas LMS tools for LangChain agent."""
+    cache_key = (
+        getattr(canvas_repo, "base_url", None) or id(canvas_repo),
+        getattr(canvas_repo, "access_token", None),
+        getattr(google_calendar_helper, "user_id", None),
+        google_calendar_helper is not None,
+    )
+    cached = _TOOLS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     helper = CanvasToolsHelper(canvas_repo)
+    # Warm the course cache while the agent is still deciding which tool
+    # to call, so name-based course resolution doesn't block on network.
+    helper.prefetch_courses()
 
     tools = []
     tools.extend(create_core_tools(helper, canvas_repo))
@@ -21,6 +42,7 @@ def create_canvas_tools(canvas_repo, google_calendar_helper=None) -> list:
         )
     )
 
+    _TOOLS_CACHE[cache_key] = tools
     return tools
 
 
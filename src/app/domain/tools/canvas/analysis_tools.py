@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from typing import Optional
 
 from langchain.tools import tool
@@ -10,6 +11,10 @@ from .base import CanvasToolsHelper
 
 _logger = logging.getLogger(__name__)
 
+# Shared fallback for assignments without a submission — avoids allocating
+# a fresh dict per lookup and cannot be mutated accidentally.
+_EMPTY = MappingProxyType({})
+
 
 def create_analysis_tools(
     helper: CanvasToolsHelper, canvas_repo, google_calendar_helper=None
@@ -60,7 +65,7 @@ def create_analysis_tools(
                     f"({week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')})!"
                 )
 
-            this_week.sort(key=lambda x: x.get("due_at", "9999-12-31"))
+            helper.sort_by_due_date(this_week)
 
             def estimate_time(a):
                 """Estimate study time in hours."""
@@ -166,21 +171,10 @@ def create_analysis_tools(
         now = datetime.now(timezone.utc)
         end_date = now + timedelta(days=days_ahead)
 
-        upcoming = []
-        for a in assignments:
-            due_dt = helper.parse_date(a.get("due_at"))
-            if due_dt:
-                if due_dt.tzinfo is None:
-                    due_dt = due_dt.replace(tzinfo=timezone.utc)
-                if now <= due_dt <= end_date:
-                    upcoming.append(a)
-
         by_day: dict[str, list] = {}
-        for a in upcoming:
+        for a in assignments:
             due_dt = helper.parse_date(a.get("due_at"))
-            if due_dt:
-                if due_dt.tzinfo is None:
-                    due_dt = due_dt.replace(tzinfo=timezone.utc)
+            if due_dt and now <= due_dt <= end_date:
                 day_key = due_dt.strftime("%Y-%m-%d (%A)")
                 by_day.setdefault(day_key, []).append(a)
 
@@ -226,14 +220,14 @@ def create_analysis_tools(
             course_id, include=["submission"]
         )
 
-        pending = [
-            a
-            for a in assignments
-            if (a.get("submission") or {}).get("workflow_state", "unsubmitted")
-            in ("unsubmitted", "submitted")
-        ]
+        pending = []
+        for a in assignments:
+            ws = (a.get("submission") or _EMPTY).get("workflow_state", "unsubmitted")
+            if ws in ("unsubmitted", "submitted"):
+                pending.append((a, ws))
 
-        def priority_score(a):
+        def priority_score(item):
+            a, ws = item
             score = 0
             days = helper.days_until_due(a.get("due_at"))
             if days < 0:
@@ -250,7 +244,6 @@ def create_analysis_tools(
             pts = a.get("points_possible", 0)
             score += min(30, pts * 0.3)
 
-            ws = (a.get("submission") or {}).get("workflow_state", "unsubmitted")
             score += 30 if ws == "unsubmitted" else 15
 
             return score
@@ -263,10 +256,11 @@ def create_analysis_tools(
         if not pending:
             lines.append("No pending assignments! 🎉")
         else:
-            for i, a in enumerate(pending[:15], 1):
+            for i, item in enumerate(pending[:15], 1):
+                a = item[0]
                 days = helper.days_until_due(a.get("due_at"))
                 urgency = "OVERDUE" if days < 0 else f"⏰ {days} days"
-                ps = priority_score(a)
+                ps = priority_score(item)
                 lines.append(
                     f"{i}. **{a.get('name', 'Unnamed')}** – {urgency} | "
                     f"{a.get('points_possible', 'N/A')} pts | "
@@ -5,8 +5,15 @@ downloading all assignments and filtering locally.
 
 Canvas API bucket values:
   past | overdue | undated | ungraded | unsubmitted | upcoming | future
+
+``include=["submission"]`` roughly doubles the Canvas payload per
+assignment, so only tools whose output actually renders submission fields
+request it (currently just get_assignment_submission_status here — the
+bucket tools all format via format_assignments, which never reads them).
 """
 
+import io
+from datetime import datetime, timezone
 from typing import Optional
 
 from langchain.tools import tool
@@ -33,9 +40,7 @@ def create_assignment_tools(helper: CanvasToolsHelper):
             course_identifier: Optional course name, code, or ID.
         """
         course_id, course_name = helper.resolve_course_id(course_identifier)
-        assignments = helper.get_assignments_for_courses(
-            course_id, include=["submission"], bucket="overdue"
-        )
+        assignments = helper.get_assignments_for_courses(course_id, bucket="overdue")
         title = f"{course_name} - Overdue" if course_id else "All Courses - Overdue"
         return (
             format_assignments(assignments, title)
@@ -58,7 +63,7 @@ def create_assignment_tools(helper: CanvasToolsHelper):
         """
         course_id, course_name = helper.resolve_course_id(course_identifier)
         assignments = helper.get_assignments_for_courses(
-            course_id, include=["submission"], bucket="unsubmitted"
+            course_id, bucket="unsubmitted"
         )
         title = (
             f"{course_name} - Unsubmitted" if course_id else "All Courses - Unsubmitted"
@@ -86,10 +91,8 @@ def create_assignment_tools(helper: CanvasToolsHelper):
             course_identifier: Optional course name, code, or ID.
         """
         course_id, course_name = helper.resolve_course_id(course_identifier)
-        assignments = helper.get_assignments_for_courses(
-            course_id, include=["submission"], bucket="upcoming"
-        )
-        assignments.sort(key=lambda x: x.get("due_at") or "9999-12-31")
+        assignments = helper.get_assignments_for_courses(course_id, bucket="upcoming")
+        helper.sort_by_due_date(assignments)
         title = f"{course_name} - Upcoming" if course_id else "All Courses - Upcoming"
         return format_assignments(assignments, title)
 
@@ -106,10 +109,8 @@ def create_assignment_tools(helper: CanvasToolsHelper):
             course_identifier: Optional course name, code, or ID.
         """
         course_id, course_name = helper.resolve_course_id(course_identifier)
-        assignments = helper.get_assignments_for_courses(
-            course_id, include=["submission"], bucket="past"
-        )
-        assignments.sort(key=lambda x: x.get("due_at") or "0000-01-01", reverse=True)
+        assignments = helper.get_assignments_for_courses(course_id, bucket="past")
+        helper.sort_by_due_date(assignments, reverse=True)
         title = f"{course_name} - Past" if course_id else "All Courses - Past"
         return format_assignments(assignments, title)
 
@@ -127,7 +128,7 @@ def create_assignment_tools(helper: CanvasToolsHelper):
         """
         course_id, course_name = helper.resolve_course_id(course_identifier)
         assignments = helper.get_assignments_for_courses(course_id, bucket="future")
-        assignments.sort(key=lambda x: x.get("due_at") or "9999-12-31")
+        helper.sort_by_due_date(assignments)
         title = f"{course_name} - Future" if course_id else "All Courses - Future"
         return format_assignments(assignments, title)
 
@@ -145,9 +146,7 @@ def create_assignment_tools(helper: CanvasToolsHelper):
             course_identifier: Optional course name, code, or ID.
         """
         course_id, course_name = helper.resolve_course_id(course_identifier)
-        assignments = helper.get_assignments_for_courses(
-            course_id, include=["submission"], bucket="ungraded"
-        )
+        assignments = helper.get_assignments_for_courses(course_id, bucket="ungraded")
         title = (
             f"{course_name} - Awaiting Grade"
             if course_id
@@ -178,17 +177,23 @@ def create_assignment_tools(helper: CanvasToolsHelper):
         """
         course_id, _ = helper.resolve_course_id(course_identifier)
         assignments = helper.get_assignments_for_courses(
-            course_id, include=["submission"]
+            course_id, include=["submission"], search_term=assignment_name
         )
+        if not assignments:
+            # Canvas title search missed (e.g. partial words) — fall back
+            # to the full list and match locally.
+            assignments = helper.get_assignments_for_courses(
+                course_id, include=["submission"]
+            )
 
         needle = assignment_name.lower()
         for a in assignments:
             if needle in a.get("name", "").lower():
                 submission = a.get("submission", {})
-                lines = [f"# Submission Status: {a.get('name')}\n"]
-                lines.append(
+                lines = [
+                    f"# Submission Status: {a.get('name')}\n\n"
                     f"**Status:** {submission.get('workflow_state', 'Not submitted')}"
-                )
+                ]
 
                 if submission.get("submitted_at"):
                     lines.append(f"**Submitted At:** {submission['submitted_at']}")
@@ -240,7 +245,17 @@ def create_assignment_tools(helper: CanvasToolsHelper):
             return "Invalid date format. Please use YYYY-MM-DD format."
 
         course_id, course_name = helper.resolve_course_id(course_identifier)
-        assignments = helper.get_assignments_for_courses(course_id)
+
+        # Narrow server-side when the window lies entirely in the past or
+        # future, so Canvas doesn't ship assignments we'd filter out anyway.
+        now = datetime.now(timezone.utc)
+        bucket = None
+        if end_dt < now:
+            bucket = "past"
+        elif start_dt > now:
+            bucket = "future"
+
+        assignments = helper.get_assignments_for_courses(course_id, bucket=bucket)
 
         filtered = []
         for a in assignments:
@@ -248,7 +263,7 @@ def create_assignment_tools(helper: CanvasToolsHelper):
             if due_dt and start_dt <= due_dt <= end_dt:
                 filtered.append(a)
 
-        filtered.sort(key=lambda x: x.get("due_at") or "9999-12-31")
+        helper.sort_by_due_date(filtered)
         title = f"Assignments Due {start_date} to {end_date}"
         if course_id:
             title += f" - {course_name}"
@@ -269,10 +284,11 @@ def create_assignment_tools(helper: CanvasToolsHelper):
             search_term: Text to match in assignment titles.
             course_identifier: Optional course name, code, or ID.
         """
-        course_id, course_name = helper.resolve_course_id(course_identifier)
-        assignments = helper.get_assignments_for_courses(
-            course_id, search_term=search_term
+        course_id, course_name, assignments = helper.resolve_and_fetch_assignments(
+            course_identifier, search_term=search_term
         )
+        if course_identifier and course_id is None:
+            return course_name
         title = f"Search: '{search_term}'"
         if course_id:
             title = f"{course_name} - {title}"
@@ -298,8 +314,9 @@ def create_assignment_tools(helper: CanvasToolsHelper):
             course_identifier: Optional course name, code, or ID.
         """
         course_id, course_name = helper.resolve_course_id(course_identifier)
-        assignments = helper.get_assignments_for_courses(course_id)
-        filtered = helper.filter_by_submission_type(assignments, assignment_type)
+        filtered = helper.get_assignments_by_submission_type(
+            course_id, assignment_type
+        )
 
         type_labels = {
             "online_quiz": "Quizzes",
@@ -331,24 +348,30 @@ def create_assignment_tools(helper: CanvasToolsHelper):
         peer_reviews = [a for a in assignments if a.get("peer_reviews")]
 
         scope = course_name if course_id else "All Courses"
-        lines = [f"# Peer Review Assignments - {scope}\n"]
+        # Write straight into one buffer — no list of fragments plus a
+        # second full-size joined copy for large courses.
+        buf = io.StringIO()
+        buf.write(f"# Peer Review Assignments - {scope}\n\n")
 
         if not peer_reviews:
-            lines.append("No peer review assignments found.")
+            buf.write("No peer review assignments found.")
         else:
             for i, a in enumerate(peer_reviews, 1):
                 auto = a.get("automatic_peer_reviews", False)
-                lines.append(f"{i}. **{a.get('name', 'Unnamed')}**")
-                lines.append(f"   - **Due:** {a.get('due_at', 'No due date')}")
-                lines.append(f"   - **Points:** {a.get('points_possible', 'N/A')}")
-                lines.append(f"   - **Auto-assigned:** {'Yes' if auto else 'No'}")
-                if auto:
-                    lines.append(
-                        f"   - **Reviews Required:** {a.get('peer_review_count', 'N/A')}"
-                    )
-                lines.append("")
-
-        return "\n".join(lines)
+                extra = (
+                    f"   - **Reviews Required:** {a.get('peer_review_count', 'N/A')}\n"
+                    if auto
+                    else ""
+                )
+                buf.write(
+                    f"{i}. **{a.get('name', 'Unnamed')}**\n"
+                    f"   - **Due:** {a.get('due_at', 'No due date')}\n"
+                    f"   - **Points:** {a.get('points_possible', 'N/A')}\n"
+                    f"   - **Auto-assigned:** {'Yes' if auto else 'No'}\n"
+                    f"{extra}\n"
+                )
+
+        return buf.getvalue()
 
     return [
         get_overdue_assignments,
@@ -1,8 +1,84 @@
 """Canvas tools helper class with shared utilities."""
 
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
+from cachetools import TTLCache
+
+# Optional accelerator (same arrangement as re2/numpy elsewhere): an
+# Aho-Corasick automaton matches many needles against every assignment
+# name in one linear pass instead of one substring scan per needle.
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+# Bounded fan-out concurrency so a student with many courses doesn't
+# trip Canvas API rate limits.
+_MAX_FETCH_WORKERS = 8
+
+# Assignments change rarely within one conversation; a short TTL keeps
+# repeated tool calls from re-hitting Canvas while staying fresh enough.
+_ASSIGNMENTS_CACHE_TTL = 90
+
+# Course lists survive across helper instances (a fresh helper is built
+# per agent turn), keyed by Canvas host + token. Enrollment changes are
+# rare, so a longer TTL is safe.
+_COURSES_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+# cachetools containers aren't thread-safe — TTLCache mutates internal
+# state even on reads (expiry eviction) — and the course cache is shared
+# between request threads and the prefetch daemon thread, so every
+# get/set/pop goes through this lock.
+_COURSES_CACHE_LOCK = threading.Lock()
+
+# Course-level grades, keyed like _COURSES_CACHE. One agent turn often
+# hits the grades tool twice ("show my grades", "what about math?"); a
+# minute of staleness is acceptable for a running grade.
+_GRADES_CACHE: TTLCache = TTLCache(maxsize=128, ttl=60)
+
+# Resolved (identifier -> course) pairs. Nearly every tool call starts
+# with resolve_course_id, so even the index scan is worth skipping on
+# repeats. Only successful resolutions are stored.
+_RESOLUTION_CACHE: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Memoized date parsing — due_at values repeat across tool calls."""
+    # Fast path for Canvas's canonical "YYYY-MM-DDTHH:MM:SSZ" shape:
+    # direct slicing skips fromisoformat's format detection entirely.
+    if len(date_str) == 20 and date_str[10] == "T" and date_str[19] == "Z":
+        try:
+            return datetime(
+                int(date_str[0:4]),
+                int(date_str[5:7]),
+                int(date_str[8:10]),
+                int(date_str[11:13]),
+                int(date_str[14:16]),
+                int(date_str[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    try:
+        dt = datetime.fromisoformat(date_str)
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    except Exception:
+        pass
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S"):
+        try:
+            dt = datetime.strptime(date_str, fmt)
+            return dt.replace(tzinfo=timezone.utc)
+        except Exception:
+            continue
+    return None
+
 
 class CanvasToolsHelper:
     """Shared helper class for Canvas tools.
@@ -15,20 +91,143 @@ class CanvasToolsHelper:
     def __init__(self, canvas_repo):
         self.canvas_repo = canvas_repo
         self._courses_cache: Optional[List[Dict[str, Any]]] = None
+        self._courses_index: List[tuple] = []
+        self._courses_by_exact: Dict[str, Dict[str, Any]] = {}
+        self._courses_by_id: Dict[int, Dict[str, Any]] = {}
+        self._course_ngram_index: Dict[str, set] = {}
+        self._assignments_cache: TTLCache = TTLCache(
+            maxsize=128, ttl=_ASSIGNMENTS_CACHE_TTL
+        )
+        self._inflight: Dict[tuple, Future] = {}
+        # Guards _inflight and the two assignment caches above/below:
+        # the fan-out pool threads read and write them concurrently, and
+        # cachetools offers no thread safety of its own.
+        self._inflight_lock = threading.Lock()
+        self._assignment_names: TTLCache = TTLCache(
+            maxsize=128, ttl=_ASSIGNMENTS_CACHE_TTL
+        )
+        self._by_type_index: TTLCache = TTLCache(
+            maxsize=32, ttl=_ASSIGNMENTS_CACHE_TTL
+        )
+        self._name_index: TTLCache = TTLCache(maxsize=64, ttl=120)
+
+    def prefetch_courses(self) -> None:
+        """Warm the course cache in a background thread.
+
+        Called at tool-creation time so that by the first tool invocation,
+        string-based course resolution (``resolve_course_id`` with a name
+        or code) is an in-memory index lookup instead of a blocking
+        "list all courses" round-trip. A failed prefetch is harmless —
+        the first real ``get_courses()`` call simply fetches as before.
+        """
+        if self._courses_cache is not None:
+            return
+        with _COURSES_CACHE_LOCK:
+            if _COURSES_CACHE.get(self._courses_key()) is not None:
+                return
+
+        def warm() -> None:
+            try:
+                self.get_courses()
+            except Exception:
+                pass
+
+        threading.Thread(target=warm, daemon=True).start()
+
+    def _courses_key(self) -> tuple:
+        """Cache key identifying this user's Canvas account."""
+        repo = self.canvas_repo
+        return (
+            getattr(repo, "base_url", None) or id(repo),
+            getattr(repo, "access_token", None),
+        )
+
+    @staticmethod
+    def _trigrams(text: str) -> set:
+        """Sliding 3-grams of *text*; empty for shorter strings."""
+        return {text[i : i + 3] for i in range(len(text) - 2)}
+
+    def _set_courses(self, courses: List[Dict[str, Any]]) -> None:
+        """Store the course list and precompute its lookup indexes.
+
+        Casefolding names/codes once here keeps find_course_by_name_or_code
+        free of per-call string work, and the trigram index lets it narrow
+        substring candidates with set intersections instead of scanning
+        every course name.
+        """
+        self._courses_cache = courses
+        self._courses_index = [
+            (c, c.get("name", "").casefold(), c.get("course_code", "").casefold())
+            for c in courses
+        ]
+        self._courses_by_exact = {}
+        self._courses_by_id = {c.get("id"): c for c in courses}
+        self._course_ngram_index = {}
+        for i, (c, name_cf, code_cf) in enumerate(self._courses_index):
+            self._courses_by_exact.setdefault(name_cf, c)
+            if code_cf:
+                self._courses_by_exact.setdefault(code_cf, c)
+            for gram in self._trigrams(name_cf) | self._trigrams(code_cf):
+                self._course_ngram_index.setdefault(gram, set()).add(i)
 
     def get_courses(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """Get active courses with caching."""
-        if self._courses_cache is None or refresh:
-            self._courses_cache = self.canvas_repo.get_active_courses()
-        return self._courses_cache
+        if not refresh:
+            if self._courses_cache is not None:
+                return self._courses_cache
+            with _COURSES_CACHE_LOCK:
+                cached = _COURSES_CACHE.get(self._courses_key())
+            if cached is not None:
+                self._set_courses(cached)
+                return cached
+
+        courses = self.canvas_repo.get_active_courses()
+        self._set_courses(courses)
+        with _COURSES_CACHE_LOCK:
+            _COURSES_CACHE[self._courses_key()] = courses
+        return courses
+
+    def invalidate_courses(self) -> None:
+        """Drop the cached course list (e.g., enrollment changed)."""
+        self._courses_cache = None
+        self._courses_index = []
+        self._courses_by_exact = {}
+        self._courses_by_id = {}
+        self._course_ngram_index = {}
+        key = self._courses_key()
+        with _COURSES_CACHE_LOCK:
+            _COURSES_CACHE.pop(key, None)
+        for rkey in [k for k in _RESOLUTION_CACHE if k[0] == key]:
+            _RESOLUTION_CACHE.pop(rkey, None)
 
     def find_course_by_name_or_code(self, search_term: str) -> Optional[Dict[str, Any]]:
         """Case-insensitive partial match on course name or code."""
-        courses = self.get_courses()
-        s = search_term.lower()
-        for c in courses:
-            name = c.get("name", "").lower()
-            code = c.get("course_code", "").lower()
+        self.get_courses()
+        s = search_term.casefold()
+
+        exact = self._courses_by_exact.get(s)
+        if exact is not None:
+            return exact
+
+        # Trigram intersection narrows "s in name/code" candidates without
+        # touching every course. Only sound for queries of 3+ chars.
+        grams = self._trigrams(s)
+        if grams:
+            candidates: Optional[set] = None
+            for gram in grams:
+                hits = self._course_ngram_index.get(gram)
+                if not hits:
+                    candidates = set()
+                    break
+                candidates = hits if candidates is None else candidates & hits
+            for i in sorted(candidates or ()):
+                c, name, code = self._courses_index[i]
+                if s in name or s in code:
+                    return c
+
+        # Fallback linear scan preserves the reverse-containment semantics
+        # ("name in s") and handles 1-2 character queries.
+        for c, name, code in self._courses_index:
             if s in name or s in code or name in s or code in s:
                 return c
         return None
@@ -44,13 +243,33 @@ class CanvasToolsHelper:
         if not course_identifier:
             return None, ""
 
+        cache_key = (self._courses_key(), str(course_identifier).casefold())
+        cached = _RESOLUTION_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        resolved = self._resolve_course_id_uncached(course_identifier)
+        if resolved[0] is not None:
+            _RESOLUTION_CACHE[cache_key] = resolved
+        return resolved
+
+    def _resolve_course_id_uncached(
+        self, course_identifier: str
+    ) -> tuple[Optional[int], str]:
         try:
             cid = int(course_identifier)
+        except (ValueError, TypeError):
+            pass
+        else:
+            # Numeric IDs resolve against the cached course list first —
+            # only unknown IDs (e.g. concluded courses) hit the API.
+            self.get_courses()
+            course = self._courses_by_id.get(cid)
+            if course is not None:
+                return cid, course.get("name", "Unknown Course")
             cname = self.canvas_repo.get_course_name(cid)
             if cname:
                 return cid, cname
-        except (ValueError, TypeError):
-            pass
 
         course = self.find_course_by_name_or_code(course_identifier)
         if course:
@@ -65,6 +284,30 @@ class CanvasToolsHelper:
             f"Available courses:\n{course_list}",
         )
 
+    def resolve_and_fetch_assignments(
+        self,
+        course_identifier: Optional[str] = None,
+        include: Optional[List[str]] = None,
+        bucket: Optional[str] = None,
+        search_term: Optional[str] = None,
+    ) -> tuple[Optional[int], str, List[Dict[str, Any]]]:
+        """Resolve a course and fetch its assignments in one step.
+
+        Course resolution runs against the in-memory course index, so the
+        only network round-trip on this path is the assignments request
+        itself. Returns ``(course_id, name_or_error, assignments)``; when
+        an identifier was given but couldn't be resolved, assignments is
+        empty and the middle element carries the error message.
+        """
+        course_id, name_or_error = self.resolve_course_id(course_identifier)
+        if course_identifier and course_id is None:
+            return None, name_or_error, []
+        return (
+            course_id,
+            name_or_error,
+            self.get_assignments_for_courses(course_id, include, bucket, search_term),
+        )
+
     def get_assignments_for_courses(
         self,
         course_id: Optional[int] = None,
@@ -79,39 +322,347 @@ class CanvasToolsHelper:
         unsubmitted | upcoming | future).  No local re-filtering needed.
         """
         if course_id:
-            return self.canvas_repo.get_assignments(
-                course_id, include=include, bucket=bucket, search_term=search_term
-            )
+            return self._fetch_assignments(course_id, include, bucket, search_term)
+
+        courses = self.get_courses()
+        if not courses:
+            return []
+
+        # Repeated all-courses calls are common (search, name index,
+        # study-time estimates); when every course still has a fresh
+        # cache entry for this key, assemble locally instead of
+        # re-paying the batched round-trip inside the TTL window.
+        inc_key = tuple(sorted(include or ()))
+        cached_lists = []
+        with self._inflight_lock:
+            for course in courses:
+                cached = self._assignments_cache.get(
+                    (course["id"], inc_key, bucket, search_term)
+                )
+                if cached is None:
+                    cached_lists = None
+                    break
+                cached_lists.append((course, cached))
+        if cached_lists is not None:
+            all_assignments: List[Dict[str, Any]] = []
+            for course, assignments in cached_lists:
+                cname = course.get("name", f"Course {course['id']}")
+                for a in assignments:
+                    a["_course_name"] = cname
+                all_assignments.extend(assignments)
+            return all_assignments
+
+        # One GraphQL round-trip beats N REST calls when the request can
+        # be expressed there (no bucket/include). Falls back to the
+        # per-course fan-out when the batch endpoint declines or fails.
+        batched = self.canvas_repo.get_assignments_across_courses(
+            [c["id"] for c in courses],
+            include=include,
+            bucket=bucket,
+            search_term=search_term,
+        )
+        if batched is not None:
+            all_assignments = []
+            for course in courses:
+                assignments = batched.get(course["id"], [])
+                # Seed the per-course caches so later single-course calls
+                # (and the name index) reuse this round-trip.
+                key = (course["id"], inc_key, bucket, search_term)
+                with self._inflight_lock:
+                    self._assignments_cache[key] = assignments
+                    if bucket is None and search_term is None:
+                        self._assignment_names[course["id"]] = [
+                            a.get("name", "") for a in assignments
+                        ]
+                cname = course.get("name", f"Course {course['id']}")
+                for a in assignments:
+                    a["_course_name"] = cname
+                all_assignments.extend(assignments)
+            return all_assignments
+
+        def fetch(course: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return self._fetch_assignments(course["id"], include, bucket, search_term)
+
+        # Per-course requests are independent I/O — issue them concurrently
+        # so wall-clock latency is the slowest round-trip, not the sum.
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_FETCH_WORKERS, len(courses))
+        ) as pool:
+            results = list(pool.map(fetch, courses))
 
         all_assignments: List[Dict[str, Any]] = []
-        for course in self.get_courses():
-            cid = course["id"]
-            cname = course.get("name", f"Course {cid}")
-            assignments = self.canvas_repo.get_assignments(
-                cid, include=include, bucket=bucket, search_term=search_term
-            )
+        for course, assignments in zip(courses, results):
+            cname = course.get("name", f"Course {course['id']}")
             for a in assignments:
                 a["_course_name"] = cname
             all_assignments.extend(assignments)
         return all_assignments
 
+    def get_assignments_for_course_ids(
+        self,
+        course_ids: List[int],
+        include: Optional[List[str]] = None,
+        bucket: Optional[str] = None,
+        search_term: Optional[str] = None,
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Fetch several specific courses' assignments concurrently.
+
+        Same bounded fan-out as the all-courses path, but for an explicit
+        ID list — the building block for batched multi-course tools (e.g.
+        a forecast across every course). Results map course_id to its
+        assignment list and flow through the per-course TTL cache.
+        """
+        if not course_ids:
+            return {}
+
+        def fetch(course_id: int) -> List[Dict[str, Any]]:
+            return self._fetch_assignments(course_id, include, bucket, search_term)
+
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_FETCH_WORKERS, len(course_ids))
+        ) as pool:
+            results = pool.map(fetch, course_ids)
+        return dict(zip(course_ids, results))
+
+    def iter_course_assignments(
+        self,
+        include: Optional[List[str]] = None,
+        bucket: Optional[str] = None,
+        search_term: Optional[str] = None,
+    ):
+        """Yield ``(course, assignments)`` per course as each fetch lands.
+
+        Completion-order streaming lets callers format one course's block
+        while the remaining requests are still in flight, overlapping
+        formatter CPU with network I/O instead of serializing them.
+        """
+        courses = self.get_courses()
+        if not courses:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_FETCH_WORKERS, len(courses))
+        ) as pool:
+            futures = {
+                pool.submit(
+                    self._fetch_assignments,
+                    course["id"],
+                    include,
+                    bucket,
+                    search_term,
+                ): course
+                for course in courses
+            }
+            for future in as_completed(futures):
+                course = futures[future]
+                assignments = future.result()
+                cname = course.get("name", f"Course {course['id']}")
+                for a in assignments:
+                    a["_course_name"] = cname
+                yield course, assignments
+
+    def _fetch_assignments(
+        self,
+        course_id: int,
+        include: Optional[List[str]],
+        bucket: Optional[str],
+        search_term: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Fetch one course's assignments through the TTL cache.
+
+        Caching is per course, so a later single-course call reuses the
+        sub-results of an earlier all-courses fan-out. Returns a shallow
+        copy so callers can sort/filter without mutating the cache.
+        """
+        key = (course_id, tuple(sorted(include or ())), bucket, search_term)
+
+        # Dedup identical concurrent fetches (an agent turn often fires
+        # several tools that fan out over the same courses): followers
+        # wait on the leader's Future instead of re-issuing the request.
+        # The cache check sits inside the same critical section as the
+        # in-flight bookkeeping.
+        with self._inflight_lock:
+            cached = self._assignments_cache.get(key)
+            if cached is not None:
+                return list(cached)
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            return list(future.result())
+
+        try:
+            assignments = self.canvas_repo.get_assignments(
+                course_id, include=include, bucket=bucket, search_term=search_term
+            )
+            with self._inflight_lock:
+                self._assignments_cache[key] = assignments
+                if bucket is None and search_term is None:
+                    # A full fetch doubles as the course's
+                    # assignment-name index.
+                    self._assignment_names[course_id] = [
+                        a.get("name", "") for a in assignments
+                    ]
+            future.set_result(assignments)
+        except BaseException as e:  # propagate to waiters, then re-raise
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+        return list(assignments)
+
+    def find_assignment_by_name(
+        self,
+        course_id: Optional[int],
+        assignment_name: str,
+        include: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Look up one assignment by (partial) name via a cached index.
+
+        Names are casefolded once when the index is built, so repeated
+        lookups against the same course are a dict hit (exact match) or a
+        scan over pre-folded keys (substring) — no per-call re-lowering of
+        every assignment name.
+        """
+        index = self._get_name_index(course_id, include)
+        needle = assignment_name.casefold()
+        exact = index.get(needle)
+        if exact:
+            return exact[0]
+        return next(
+            (hits[0] for lname, hits in index.items() if needle in lname), None
+        )
+
+    def find_assignment_matches(
+        self,
+        course_id: Optional[int],
+        assignment_name: str,
+        include: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """All assignments matching a (partial) name, exact match first.
+
+        An exact (casefolded) name hit short-circuits to those
+        assignments — plural when the same name exists in several
+        courses, so callers can disambiguate instead of silently acting
+        on an arbitrary one. Otherwise every substring match is
+        returned.
+        """
+        index = self._get_name_index(course_id, include)
+        needle = assignment_name.casefold()
+        exact = index.get(needle)
+        if exact:
+            return list(exact)
+        return [a for lname, hits in index.items() if needle in lname for a in hits]
+
+    def find_assignments_for_names(
+        self,
+        course_id: Optional[int],
+        names: List[str],
+        include: Optional[List[str]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Match many (partial) names against one course in one pass.
+
+        Exact casefolded hits come straight from the name index. The
+        remaining needles are matched with an Aho-Corasick automaton when
+        pyahocorasick is installed — one scan over each assignment name
+        regardless of needle count — falling back to a per-needle
+        substring scan otherwise.
+        """
+        index = self._get_name_index(course_id, include)
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        pending: Dict[str, str] = {}
+        for name in names:
+            needle = name.casefold()
+            exact = index.get(needle)
+            if exact:
+                result[name] = list(exact)
+            else:
+                result[name] = []
+                pending[name] = needle
+
+        if not pending:
+            return result
+
+        if _ahocorasick is not None and len(pending) > 1:
+            automaton = _ahocorasick.Automaton()
+            for original, needle in pending.items():
+                automaton.add_word(needle, original)
+            automaton.make_automaton()
+            for lname, hits in index.items():
+                for original in {hit for _, hit in automaton.iter(lname)}:
+                    result[original].extend(hits)
+        else:
+            for original, needle in pending.items():
+                result[original] = [
+                    a for lname, hits in index.items() if needle in lname for a in hits
+                ]
+        return result
+
+    def _get_name_index(
+        self, course_id: Optional[int], include: Optional[List[str]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Casefolded name -> assignments carrying that exact name.
+
+        The values are lists because identical names are common across
+        courses ("Final Exam", "Week 1 Quiz"); collapsing them to one
+        entry would make an exact lookup silently pick an arbitrary
+        assignment.
+        """
+        key = (course_id, tuple(sorted(include or ())))
+        index = self._name_index.get(key)
+        if index is None:
+            index = {}
+            for a in self.get_assignments_for_courses(course_id, include=include):
+                index.setdefault(a.get("name", "").casefold(), []).append(a)
+            self._name_index[key] = index
+        return index
+
+    def cached_all_grades(self) -> List[Dict[str, Any]]:
+        """Course grades for this user, memoized for a short window."""
+        key = self._courses_key()
+        grades = _GRADES_CACHE.get(key)
+        if grades is None:
+            grades = self.canvas_repo.get_all_grades()
+            _GRADES_CACHE[key] = grades
+        return grades
+
+    def get_cached_assignment_names(self, course_id: int) -> Optional[List[str]]:
+        """Assignment names for a course, if a full fetch already ran."""
+        with self._inflight_lock:
+            return self._assignment_names.get(course_id)
+
+    def invalidate_assignments(self) -> None:
+        """Flush cached assignment results (e.g., user asked to refresh)."""
+        with self._inflight_lock:
+            self._assignments_cache.clear()
+            self._assignment_names.clear()
+
+    @staticmethod
+    def sort_by_due_date(
+        assignments: List[Dict[str, Any]], reverse: bool = False
+    ) -> None:
+        """Sort assignments in place by ``due_at`` (undated last).
+
+        The sort key is annotated in one pass and extracted with a C-level
+        ``itemgetter``, so the ``.get()``/``or`` fallback runs once per
+        assignment instead of on every Timsort comparison.
+        """
+        sentinel = "0000-01-01" if reverse else "9999-12-31"
+        for a in assignments:
+            a["_due_sort"] = a.get("due_at") or sentinel
+        assignments.sort(key=itemgetter("_due_sort"), reverse=reverse)
+
     @staticmethod
     def parse_date(date_str: str) -> Optional[datetime]:
         """Parse a date string to a timezone-aware UTC datetime."""
         if not date_str:
             return None
-        try:
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
-        except Exception:
-            pass
-        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S"):
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.replace(tzinfo=timezone.utc)
-            except Exception:
-                continue
-        return None
+        return _parse_date(date_str)
 
     @staticmethod
     def days_until_due(due_date_str: str) -> int:
@@ -127,11 +678,20 @@ class CanvasToolsHelper:
         dt = CanvasToolsHelper.parse_date(due_date_str)
         return dt is not None and dt < datetime.now(timezone.utc)
 
-    @staticmethod
-    def filter_by_submission_type(
-        assignments: List[Dict[str, Any]], submission_type: str
+    def get_assignments_by_submission_type(
+        self, course_id: Optional[int], submission_type: str
     ) -> List[Dict[str, Any]]:
-        """Filter assignments by submission_types field."""
-        return [
-            a for a in assignments if submission_type in a.get("submission_types", [])
-        ]
+        """Assignments with *submission_type*, via a cached inverted index.
+
+        The first lookup for a scope builds ``{submission_type: [...]}`` in
+        one pass; subsequent type queries against the same scope are dict
+        hits instead of per-assignment membership scans.
+        """
+        index = self._by_type_index.get(course_id)
+        if index is None:
+            index = defaultdict(list)
+            for a in self.get_assignments_for_courses(course_id):
+                for stype in a.get("submission_types", []):
+                    index[stype].append(a)
+            self._by_type_index[course_id] = index
+        return index.get(submission_type, [])
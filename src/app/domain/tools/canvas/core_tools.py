@@ -1,7 +1,11 @@
 """Core Canvas tools – courses, basic assignments, announcements, syllabus."""
 
+from operator import itemgetter
 from typing import Optional
+
+from cachetools import TTLCache
 from langchain.tools import tool
+
 from .base import CanvasToolsHelper
 from .formatters import (
     format_course_list,
@@ -9,6 +13,23 @@ from .formatters import (
     format_assignment_detailed,
 )
 
+# Syllabi change maybe once a semester — repeated "show me the syllabus"
+# turns shouldn't re-download them. Keyed by (account, course_id) so
+# different users' helpers never share entries.
+_SYLLABUS_CACHE: TTLCache = TTLCache(maxsize=64, ttl=3600)
+
+# Announcements are far more dynamic; keep the window short.
+_ANNOUNCEMENTS_CACHE: TTLCache = TTLCache(maxsize=128, ttl=90)
+
+
+def invalidate_syllabus(course_id: Optional[int] = None) -> None:
+    """Drop cached syllabi — all of them, or one course's entries."""
+    if course_id is None:
+        _SYLLABUS_CACHE.clear()
+        return
+    for key in [k for k in _SYLLABUS_CACHE if k[1] == course_id]:
+        _SYLLABUS_CACHE.pop(key, None)
+
 
 def create_core_tools(helper: CanvasToolsHelper, canvas_repo):
     """Create core Canvas tools."""
@@ -45,23 +66,24 @@ def create_core_tools(helper: CanvasToolsHelper, canvas_repo):
                              If omitted returns assignments from all courses.
         """
         course_id, course_name = helper.resolve_course_id(course_identifier)
-        assignments = helper.get_assignments_for_courses(course_id)
 
         if course_id:
+            assignments = helper.get_assignments_for_courses(course_id)
             return format_assignments(assignments, course_name)
 
-        if not assignments:
+        # Format each course's block as soon as its fetch completes, so
+        # formatter CPU overlaps the remaining in-flight requests. The
+        # final join re-sorts by course name for stable output.
+        blocks = []
+        for course, assignments in helper.iter_course_assignments():
+            if not assignments:
+                continue
+            cname = course.get("name", "Unknown")
+            blocks.append((cname, format_assignments(assignments, cname)))
+        if not blocks:
             return "No assignments found."
-
-        by_course: dict[str, list] = {}
-        for a in assignments:
-            cname = a.get("_course_name", "Unknown")
-            by_course.setdefault(cname, []).append(a)
-
-        parts = [
-            format_assignments(assgns, cname) for cname, assgns in by_course.items()
-        ]
-        return "\n\n---\n\n".join(parts)
+        blocks.sort(key=itemgetter(0))
+        return "\n\n---\n\n".join(block for _, block in blocks)
 
     @tool("get_assignment_details")
     def get_assignment_details(
@@ -91,21 +113,33 @@ def create_core_tools(helper: CanvasToolsHelper, canvas_repo):
             if needle in a.get("name", "").lower():
                 return format_assignment_detailed(a)
 
-        all_assignments = helper.get_assignments_for_courses(
-            course_id, include=["submission"]
+        # When the name index from an earlier full fetch is warm and shows
+        # no match, build the suggestions from it without re-fetching.
+        all_names = (
+            helper.get_cached_assignment_names(course_id) if course_id else None
         )
+        if all_names is not None and any(needle in n.lower() for n in all_names):
+            all_names = None  # name exists — refetch to return its details
 
-        for a in all_assignments:
-            if needle in a.get("name", "").lower():
-                return format_assignment_detailed(a)
+        if all_names is None:
+            all_assignments = helper.get_assignments_for_courses(
+                course_id, include=["submission"]
+            )
+
+            for a in all_assignments:
+                if needle in a.get("name", "").lower():
+                    return format_assignment_detailed(a)
+
+            all_names = [a.get("name", "") for a in all_assignments]
 
         scope = f"in {course_name}" if course_id else "in all your courses"
 
-        similar = []
-        for a in all_assignments:
-            name = a.get("name", "")
-            if any(word.lower() in name.lower() for word in assignment_name.split()):
-                similar.append(f"  • {name}")
+        words = [word.lower() for word in assignment_name.split()]
+        similar = [
+            f"  • {name}"
+            for name in all_names
+            if any(word in name.lower() for word in words)
+        ]
 
         if similar:
             similar_list = "\n".join(similar[:5])
@@ -140,7 +174,12 @@ def create_core_tools(helper: CanvasToolsHelper, canvas_repo):
         if course_id is None:
             return error_or_name
 
-        result = canvas_repo.get_course_syllabus_by_id(course_id)
+        cache_key = (helper._courses_key(), course_id)
+        result = _SYLLABUS_CACHE.get(cache_key)
+        if result is None:
+            result = canvas_repo.get_course_syllabus_by_id(course_id)
+            if not result.get("error"):
+                _SYLLABUS_CACHE[cache_key] = result
         if result.get("error"):
             return result["error"]
 
@@ -169,7 +208,11 @@ def create_core_tools(helper: CanvasToolsHelper, canvas_repo):
             if course_id is None:
                 return error_or_name
 
-        announcements = canvas_repo.get_announcements(course_id)
+        cache_key = (helper._courses_key(), course_id)
+        announcements = _ANNOUNCEMENTS_CACHE.get(cache_key)
+        if announcements is None:
+            announcements = canvas_repo.get_announcements(course_id)
+            _ANNOUNCEMENTS_CACHE[cache_key] = announcements
         if not announcements:
             return "No recent announcements."
 
@@ -1,25 +1,48 @@
 """Formatting utilities for Canvas tools."""
 
+import io
 import re
 from typing import Any, Dict
 
+# Compiled once — format_assignments strips tags from every description,
+# and going through re.sub would re-do the pattern-cache lookup each time.
+# google-re2 (linear-time DFA engine, runs outside the GIL) is preferred
+# when installed; stdlib re is the fallback. The pattern itself has no
+# backtracking hazard, so behaviour is identical either way.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+_HTML_TAG_RE = _re_engine.compile(r"<[^>]+>")
+
+# %-template for one assignment block. Parsed once at import; f-strings
+# would re-execute their format machinery for every assignment in the
+# loop. The last two slots take the optional overview/url lines ("" when
+# absent).
+_ASSIGNMENT_TMPL = (
+    "%d. **%s**\n"
+    "   - **Due:** %s\n"
+    "   - **Points:** %s\n"
+    "%s%s\n"
+)
+
 
 def format_course_list(courses: list[Dict[str, Any]]) -> str:
     """Format the list of courses into a readable string."""
     if not courses:
         return "You are not enrolled in any active courses."
 
-    result = ["Your current active courses:\n"]
-    for course in courses:
-        name = course.get("name", "Unnamed")
-        code = course.get("course_code", "N/A")
-        course_id = course.get("id", "N/A")
-        start_date = course.get("start_at", "N/A")
-        result.append(
-            f"  • {name} ({code}) - ID: {course_id}, Start Date: {start_date}"
-        )
-
-    return "\n".join(result)
+    # List comprehension rather than a generator: str.join materializes
+    # its argument anyway, and the comprehension builds the list in one
+    # C-level pass without LIST_APPEND per line.
+    return "Your current active courses:\n\n" + "\n".join(
+        [
+            f"  • {c.get('name', 'Unnamed')} ({c.get('course_code', 'N/A')}) - "
+            f"ID: {c.get('id', 'N/A')}, Start Date: {c.get('start_at', 'N/A')}"
+            for c in courses
+        ]
+    )
 
 
 def format_assignments(assignments: list[Dict[str, Any]], course_name: str) -> str:
@@ -27,7 +50,10 @@ def format_assignments(assignments: list[Dict[str, Any]], course_name: str) -> s
     if not assignments:
         return f"No assignments found for {course_name}."
 
-    result = [f"# Current Assignments for {course_name}\n"]
+    # Write into one buffer instead of growing a list of small fragments
+    # and joining a second full-size copy at the end.
+    buf = io.StringIO()
+    buf.write(f"# Current Assignments for {course_name}\n\n")
 
     for i, assignment in enumerate(assignments, 1):
         name = assignment.get("name", "Unnamed Assignment")
@@ -39,23 +65,29 @@ def format_assignments(assignments: list[Dict[str, Any]], course_name: str) -> s
         clean_desc = ""
         if description:
             clean_desc = description.replace("\n", " ").strip()
-            clean_desc = re.sub(r"<[^>]+>", "", clean_desc)
+            clean_desc = _HTML_TAG_RE.sub("", clean_desc)
             if len(clean_desc) > 150:
                 clean_desc = clean_desc[:150] + "..."
 
-        result.append(f"{i}. **{name}**")
-        result.append(f"   - **Due:** {due_date}")
-        result.append(f"   - **Points:** {points}")
+        desc_block = f"   - **Overview:** {clean_desc}\n" if clean_desc else ""
+        url_block = f"   - [View Assignment]({url})\n" if url else ""
+        buf.write(
+            _ASSIGNMENT_TMPL % (i, name, due_date, points, desc_block, url_block)
+        )
 
-        if clean_desc:
-            result.append(f"   - **Overview:** {clean_desc}")
+    return buf.getvalue().rstrip("\n")
 
-        if url:
-            result.append(f"   - [View Assignment]({url})")
 
-        result.append("")
+def format_assignments_bytes(
+    assignments: list[Dict[str, Any]], course_name: str
+) -> bytes:
+    """UTF-8 encoded variant of :func:`format_assignments`.
 
-    return "\n".join(result)
+    For callers that stream the output onward as bytes (e.g. an SSE
+    response), encoding here means the text is traversed once instead of
+    being handed over as ``str`` and re-encoded at the transport layer.
+    """
+    return format_assignments(assignments, course_name).encode()
 
 
 def format_assignment_detailed(assignment: Dict[str, Any]) -> str:
@@ -70,43 +102,46 @@ def format_assignment_detailed(assignment: Dict[str, Any]) -> str:
     url = assignment.get("html_url", "")
     rubric = assignment.get("rubric", [])
 
-    result = [f"# {name}\n"]
-    result.append(f"**Points Possible:** {points}")
-    result.append(f"**Due Date:** {due_date}")
-    result.append(f"**Unlock Date:** {unlock_date}")
-    result.append(f"**Lock Date:** {lock_date}")
-    result.append(f"**Submission Types:** {submission_types}")
-    result.append(f"\n## Description\n{description}\n")
+    buf = io.StringIO()
+    w = buf.write  # bound once — the rubric loop can write dozens of lines
+    w(
+        f"# {name}\n\n"
+        f"**Points Possible:** {points}\n"
+        f"**Due Date:** {due_date}\n"
+        f"**Unlock Date:** {unlock_date}\n"
+        f"**Lock Date:** {lock_date}\n"
+        f"**Submission Types:** {submission_types}\n"
+        f"\n## Description\n{description}\n"
+    )
 
     if url:
-        result.append(f"[View Assignment in Canvas]({url})")
+        w(f"\n[View Assignment in Canvas]({url})")
 
     if rubric:
-        result.append("\n## Grading Rubric")
+        w("\n\n## Grading Rubric")
         for criterion in rubric:
             crit_desc = criterion.get("description", "No description")
-            ratings = criterion.get("ratings", [])
-            result.append(f"\n### {crit_desc}")
-            for rating in ratings:
+            w(f"\n\n### {crit_desc}")
+            for rating in criterion.get("ratings", ()):
                 points = rating.get("points", "N/A")
                 rating_desc = rating.get("description", "No description")
                 long_rating_desc = rating.get("long_description", "No description")
-                result.append(
-                    f"  - {points} points: {rating_desc} - {long_rating_desc}"
-                )
+                w(f"\n  - {points} points: {rating_desc} - {long_rating_desc}")
 
     submission = assignment.get("submission")
     if submission:
-        result.append(f"\n## Your Submission")
-        result.append(f"**Status:** {submission.get('workflow_state', 'Unknown')}")
+        w(
+            f"\n\n## Your Submission\n"
+            f"**Status:** {submission.get('workflow_state', 'Unknown')}"
+        )
         if submission.get("submitted_at"):
-            result.append(f"**Submitted:** {submission.get('submitted_at')}")
+            w(f"\n**Submitted:** {submission.get('submitted_at')}")
         if submission.get("grade"):
-            result.append(f"**Grade:** {submission.get('grade')}")
+            w(f"\n**Grade:** {submission.get('grade')}")
         if submission.get("score"):
-            result.append(f"**Score:** {submission.get('score')}/{points}")
+            w(f"\n**Score:** {submission.get('score')}/{points}")
 
-    return "\n".join(result)
+    return buf.getvalue()
 
 
 def format_grades(grades: list[Dict[str, Any]]) -> str:
@@ -114,11 +149,10 @@ def format_grades(grades: list[Dict[str, Any]]) -> str:
     if not grades:
         return "No grade information available for any courses."
 
-    result = ["Current grades for your courses:\n"]
-    for grade in grades:
-        course = grade.get("course", "Unknown Course")
-        score = grade.get("current_score", "N/A")
-        letter = grade.get("current_grade", "")
-        result.append(f"  • {course}: {score}%" + (f" ({letter})" if letter else ""))
-
-    return "\n".join(result)
+    return "Current grades for your courses:\n\n" + "\n".join(
+        [
+            f"  • {g.get('course', 'Unknown Course')}: {g.get('current_score', 'N/A')}%"
+            + (f" ({g['current_grade']})" if g.get("current_grade") else "")
+            for g in grades
+        ]
+    )
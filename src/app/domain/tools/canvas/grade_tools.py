@@ -1,10 +1,165 @@
 """Grade and statistics related Canvas tools."""
 
+from types import MappingProxyType
 from typing import Optional
 from langchain.tools import tool
 from .base import CanvasToolsHelper
 from .formatters import format_grades
 
+# NumPy collapses the forecast aggregation into a few C-level array ops
+# for big courses; the pure-Python loop below stays as the fallback so
+# numpy remains an optional accelerator rather than a dependency.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Shared read-only fallback so `or _EMPTY` doesn't allocate a fresh dict
+# for every ungraded assignment.
+_EMPTY = MappingProxyType({})
+
+# Performance levels for the grade forecast — built once, not per call.
+_FORECAST_SCENARIOS = (
+    ("Perfect (100%)", 1.0),
+    ("Excellent (90%)", 0.9),
+    ("Good (80%)", 0.8),
+    ("Average (70%)", 0.7),
+    ("Passing (60%)", 0.6),
+)
+
+
+def _na(value):
+    """Display fallback for absent statistics."""
+    return "N/A" if value is None else value
+
+
+def _forecast_totals(assignments: list) -> tuple[float, float, float]:
+    """Aggregate ``(total_earned, total_possible, pending_points)``.
+
+    Graded assignments contribute score and points to the earned totals;
+    ungraded ones with points contribute to the pending pool.
+    """
+    if _np is not None and len(assignments) >= 64:
+        pts = _np.fromiter(
+            (a.get("points_possible") or 0 for a in assignments),
+            dtype=_np.float64,
+            count=len(assignments),
+        )
+        scores = _np.fromiter(
+            (
+                score
+                if (score := (a.get("submission") or {}).get("score")) is not None
+                else _np.nan
+                for a in assignments
+            ),
+            dtype=_np.float64,
+            count=len(assignments),
+        )
+        graded = ~_np.isnan(scores)
+        return (
+            float(scores[graded].sum()),
+            float(pts[graded].sum()),
+            float(pts[~graded & (pts > 0)].sum()),
+        )
+
+    total_earned = 0
+    total_possible = 0
+    pending_points = 0
+    for a in assignments:
+        get = a.get
+        pts = get("points_possible") or 0
+        score = (get("submission") or _EMPTY).get("score")
+        if score is not None:
+            total_earned += score
+            total_possible += pts
+        elif pts > 0:
+            pending_points += pts
+    return total_earned, total_possible, pending_points
+
+
+def _stats_for_name(
+    helper: CanvasToolsHelper,
+    assignment_name: str,
+    course_identifier: Optional[str],
+) -> str:
+    """Statistics block for one assignment name."""
+    course_id, _ = helper.resolve_course_id(course_identifier)
+    matches = helper.find_assignment_matches(
+        course_id, assignment_name, include=["score_statistics", "submission"]
+    )
+    return _render_stats(assignment_name, matches)
+
+
+def _render_stats(assignment_name: str, matches: list) -> str:
+    """Render the comparison block for one name's index matches.
+
+    Shared by the single and batch statistics tools; the helper's name
+    index means N names against one course still cost one Canvas fetch.
+    """
+    if len(matches) > 1:
+        options = "\n".join(f"  • {m.get('name')}" for m in matches[:10])
+        return (
+            f"'{assignment_name}' matches several assignments:\n{options}\n\n"
+            f"Please ask again with the exact assignment name."
+        )
+    if not matches:
+        return f"Assignment '{assignment_name}' not found."
+
+    a = matches[0]
+    stats = a.get("score_statistics")
+    submission = a.get("submission", {})
+
+    lines = [f"# Performance Comparison: {a.get('name')}\n"]
+
+    if not stats:
+        lines.append(
+            "Statistics not available (requires at least 5 graded "
+            "submissions or instructor has disabled statistics)."
+        )
+        mean = median = upper_q = lower_q = None
+    else:
+        # Bind every stat once — both the header block and the
+        # comparison block below read them.
+        mean = stats.get("mean")
+        median = stats.get("median")
+        upper_q = stats.get("upper_q")
+        lower_q = stats.get("lower_q")
+        lines.append(f"**Class Mean (Average):** {_na(mean)}")
+        lines.append(f"**Class Median:** {_na(median)}")
+        lines.append(f"**Class High Score:** {_na(stats.get('max'))}")
+        lines.append(f"**Class Low Score:** {_na(stats.get('min'))}")
+        lines.append(f"**Upper Quartile (75th):** {_na(upper_q)}")
+        lines.append(f"**Lower Quartile (25th):** {_na(lower_q)}")
+
+    if submission.get("score") is not None:
+        your_score = submission["score"]
+        lines.append("\n## Your Performance")
+        lines.append(f"**Your Score:** {your_score}")
+
+        if stats:
+            # `is not None` so a class average of exactly 0 still
+            # produces a comparison line.
+            if mean is not None:
+                diff = your_score - mean
+                if diff > 0:
+                    lines.append(f"**vs. Average:** {diff:.2f} points above 📈")
+                elif diff < 0:
+                    lines.append(f"**vs. Average:** {abs(diff):.2f} points below 📉")
+                else:
+                    lines.append("**vs. Average:** Right at the average")
+
+            if None not in (upper_q, lower_q, median):
+                if your_score >= upper_q:
+                    lines.append("**Percentile:** Top 25% of the class! 🌟")
+                elif your_score >= median:
+                    lines.append("**Percentile:** Above median (50th–75th)")
+                elif your_score >= lower_q:
+                    lines.append("**Percentile:** Below median (25th–50th)")
+                else:
+                    lines.append("**Percentile:** Bottom 25%")
+
+    return "\n".join(lines)
+
 
 def create_grade_tools(helper: CanvasToolsHelper, canvas_repo):
     """Create grade-related Canvas tools."""
@@ -32,7 +187,7 @@ def create_grade_tools(helper: CanvasToolsHelper, canvas_repo):
             if course_id is None:
                 return error_or_name
 
-            grades = canvas_repo.get_all_grades()
+            grades = helper.cached_all_grades()
             for grade in grades:
                 if grade.get("course") == error_or_name:
                     score = grade.get("current_score", "N/A")
@@ -42,7 +197,7 @@ def create_grade_tools(helper: CanvasToolsHelper, canvas_repo):
                     )
             return f"No grade information available for {error_or_name}."
 
-        grades = canvas_repo.get_all_grades()
+        grades = helper.cached_all_grades()
         return format_grades(grades)
 
     @tool("get_assignment_score_statistics")
@@ -62,65 +217,33 @@ def create_grade_tools(helper: CanvasToolsHelper, canvas_repo):
             assignment_name: Full or partial name of the assignment.
             course_identifier: Optional course name, code, or ID.
         """
-        course_id, _ = helper.resolve_course_id(course_identifier)
-        assignments = helper.get_assignments_for_courses(
-            course_id, include=["score_statistics", "submission"]
-        )
+        return _stats_for_name(helper, assignment_name, course_identifier)
 
-        needle = assignment_name.lower()
-        for a in assignments:
-            if needle in a.get("name", "").lower():
-                stats = a.get("score_statistics")
-                submission = a.get("submission", {})
+    @tool("get_assignment_score_statistics_batch")
+    def get_assignment_score_statistics_batch(
+        assignment_names: list[str], course_identifier: Optional[str] = None
+    ) -> str:
+        """Get class-wide score statistics for SEVERAL assignments at once.
 
-                lines = [f"# Performance Comparison: {a.get('name')}\n"]
+        Fetches the course's statistics in a single Canvas request and
+        answers every name from memory — prefer this over repeated
+        get_assignment_score_statistics calls.
 
-                if not stats:
-                    lines.append(
-                        "Statistics not available (requires at least 5 graded "
-                        "submissions or instructor has disabled statistics)."
-                    )
-                else:
-                    lines.append(f"**Class Mean (Average):** {stats.get('mean', 'N/A')}")
-                    lines.append(f"**Class Median:** {stats.get('median', 'N/A')}")
-                    lines.append(f"**Class High Score:** {stats.get('max', 'N/A')}")
-                    lines.append(f"**Class Low Score:** {stats.get('min', 'N/A')}")
-                    lines.append(f"**Upper Quartile (75th):** {stats.get('upper_q', 'N/A')}")
-                    lines.append(f"**Lower Quartile (25th):** {stats.get('lower_q', 'N/A')}")
-
-                if submission.get("score") is not None:
-                    your_score = submission["score"]
-                    lines.append("\n## Your Performance")
-                    lines.append(f"**Your Score:** {your_score}")
-
-                    if stats:
-                        mean = stats.get("mean")
-                        median = stats.get("median")
-                        upper_q = stats.get("upper_q")
-                        lower_q = stats.get("lower_q")
-
-                        if mean:
-                            diff = your_score - mean
-                            if diff > 0:
-                                lines.append(f"**vs. Average:** {diff:.2f} points above 📈")
-                            elif diff < 0:
-                                lines.append(f"**vs. Average:** {abs(diff):.2f} points below 📉")
-                            else:
-                                lines.append("**vs. Average:** Right at the average")
-
-                        if upper_q and lower_q and median:
-                            if your_score >= upper_q:
-                                lines.append("**Percentile:** Top 25% of the class! 🌟")
-                            elif your_score >= median:
-                                lines.append("**Percentile:** Above median (50th–75th)")
-                            elif your_score >= lower_q:
-                                lines.append("**Percentile:** Below median (25th–50th)")
-                            else:
-                                lines.append("**Percentile:** Bottom 25%")
-
-                return "\n".join(lines)
+        Use when the user asks:
+        - "How did I do on Quiz 1, Quiz 2, and the midterm?"
+        - "Compare my scores to the class for all my exams"
 
-        return f"Assignment '{assignment_name}' not found."
+        Args:
+            assignment_names: Full or partial names of the assignments.
+            course_identifier: Optional course name, code, or ID.
+        """
+        course_id, _ = helper.resolve_course_id(course_identifier)
+        by_name = helper.find_assignments_for_names(
+            course_id, assignment_names, include=["score_statistics", "submission"]
+        )
+        return "\n\n---\n\n".join(
+            _render_stats(name, by_name[name]) for name in assignment_names
+        )
 
     @tool("get_grade_impact_forecast")
     def get_grade_impact_forecast(course_identifier: str) -> str:
@@ -140,20 +263,15 @@ def create_grade_tools(helper: CanvasToolsHelper, canvas_repo):
         if not course_id:
             return "Please specify a valid course."
 
-        assignments = canvas_repo.get_assignments(course_id, include=["submission"])
-
-        total_earned = 0
-        total_possible = 0
-        pending_points = 0
+        # One GraphQL round-trip for assignments + the viewer's scores;
+        # REST with include=["submission"] remains the fallback.
+        assignments = canvas_repo.graphql_assignments_with_submission(course_id)
+        if assignments is None:
+            assignments = canvas_repo.get_assignments(
+                course_id, include=["submission"]
+            )
 
-        for a in assignments:
-            pts = a.get("points_possible", 0)
-            score = (a.get("submission") or {}).get("score")
-            if score is not None:
-                total_earned += score
-                total_possible += pts
-            elif pts > 0:
-                pending_points += pts
+        total_earned, total_possible, pending_points = _forecast_totals(assignments)
 
         current_grade = (
             (total_earned / total_possible * 100) if total_possible > 0 else 0
@@ -166,16 +284,15 @@ def create_grade_tools(helper: CanvasToolsHelper, canvas_repo):
         lines.append(f"**Pending Assignments:** {pending_points} pts\n")
         lines.append("## Forecast Scenarios\n")
 
-        for label, mult in [
-            ("Perfect (100%)", 1.0),
-            ("Excellent (90%)", 0.9),
-            ("Good (80%)", 0.8),
-            ("Average (70%)", 0.7),
-            ("Passing (60%)", 0.6),
-        ]:
-            proj = total_earned + pending_points * mult
-            pct = (proj / total_with_pending * 100) if total_with_pending > 0 else 0
-            lines.append(f"**{label}:** {pct:.2f}%")
+        # Hoist the zero-denominator branch out of the loop and trade the
+        # five divisions for multiplications by a precomputed reciprocal.
+        if total_with_pending > 0:
+            inv = 100.0 / total_with_pending
+            for label, mult in _FORECAST_SCENARIOS:
+                pct = (total_earned + pending_points * mult) * inv
+                lines.append(f"**{label}:** {pct:.2f}%")
+        else:
+            lines.extend(f"**{label}:** 0.00%" for label, _ in _FORECAST_SCENARIOS)
 
         lines.append(
             f"\n*Note: assumes all pending assignments total {pending_points} pts.*"
@@ -185,5 +302,6 @@ def create_grade_tools(helper: CanvasToolsHelper, canvas_repo):
     return [
         get_course_grades,
         get_assignment_score_statistics,
+        get_assignment_score_statistics_batch,
         get_grade_impact_forecast,
     ]
@@ -5,14 +5,223 @@ including creating, updating, deleting, and querying events with proper
 timezone handling.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional
+from urllib.parse import quote
 
+from cachetools import TTLCache
 from langchain.tools import tool
 
 _logger = logging.getLogger(__name__)
 
+# Timezone per user_id, shared across helper instances. A fresh helper is
+# built for every agent turn, so an instance-only cache would re-fetch
+# /users/me/settings/timezone on each turn; timezones essentially never
+# change, so a day-long TTL is safe.
+_TZ_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=86_400)
+
+# Built tool lists per (service, user). Rebuilding re-runs the @tool
+# decorator for every closure — docstring parse plus pydantic schema
+# inference — on each agent turn; reusing the list skips all of that.
+# Same pattern as the Canvas tools package.
+_TOOLS_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+# Partial-response mask for event listings. format_event only reads
+# these six fields, while a full event resource carries ~30; asking
+# Google for just what we render shrinks the response payload (and its
+# JSON decode) several-fold.
+_EVENT_FIELDS_MASK = "items(id,summary,start,end,location,status),nextPageToken"
+
+# Constant query prefix for the listing tools, URL-encoded once at
+# import. Passing a prebuilt query string via the endpoint skips httpx's
+# per-call params dict build and re-encoding of values that never vary;
+# only the time bounds / search text get quoted per call.
+_LIST_QUERY_PREFIX = "?singleEvents=true&orderBy=startTime&fields=" + quote(
+    _EVENT_FIELDS_MASK, safe=""
+)
+
+# Shared invariant params for the tools that still pass a dict (their
+# time bounds come from user input, so they keep httpx's quoting);
+# unpacking this template beats re-keying the constant entries per call.
+_CALENDAR_STATIC_PARAMS = {
+    "singleEvents": "true",
+    "orderBy": "startTime",
+    "fields": _EVENT_FIELDS_MASK,
+}
+
+# Reminder overrides per event kind — the inner dicts never vary, so the
+# tools shallow-copy these tuples into each event body instead of
+# rebuilding the literals on every call.
+_EVENT_REMINDERS = (
+    {"method": "popup", "minutes": 1440},
+    {"method": "popup", "minutes": 60},
+)
+_ALL_DAY_REMINDERS = ({"method": "popup", "minutes": 1440},)
+_ASSIGNMENT_REMINDERS = (
+    {"method": "popup", "minutes": 60},
+    {"method": "popup", "minutes": 1440},
+)
+_STUDY_REMINDERS = (
+    {"method": "email", "minutes": 1440},
+    {"method": "popup", "minutes": 60},
+)
+
+# One-call field extraction for check_availability's event loop; falls
+# back to per-field .get() for the rare event missing one of the keys.
+_EVENT_SLOT_FIELDS = itemgetter("start", "end", "summary")
+
+# All 1440 `%I:%M %p` renders, computed once at import. strftime is a C
+# call with locale lookups per invocation; a slot render only depends on
+# (hour, minute), so check_availability indexes this with hour*60+minute.
+_HHMM_AMPM = tuple(
+    f"{(h % 12 or 12):02d}:{m:02d} {'AM' if h < 12 else 'PM'}"
+    for h in range(24)
+    for m in range(60)
+)
+
+_DAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+
+def _ymd(dt: datetime) -> str:
+    """`%Y-%m-%d` without going through the strftime format interpreter."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+@lru_cache(maxsize=4)
+def _today_strings(bucket: int) -> tuple[str, str]:
+    """(today, tomorrow) as `%Y-%m-%d`, memoized per wall-clock second.
+
+    Tool chains often fire several calendar calls within the same second;
+    bucketing on ``int(time.time())`` lets them share one ``datetime.now``
+    plus the two date renders.
+    """
+    del bucket  # only part of the cache key
+    now = datetime.now(timezone.utc)
+    return _ymd(now), _ymd(now + timedelta(days=1))
+
+
+def _utc_isoformat(dt: datetime) -> str:
+    """RFC3339 with a `Z` suffix for a UTC datetime.
+
+    isoformat() on an aware datetime walks the tzinfo to render
+    `+00:00`; the callers here always hold UTC, so the suffix is a
+    constant and the fields can be written straight into an f-string.
+    """
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+    )
+
+
+def _add_days_to_yyyy_mm_dd(s: str, n: int) -> str:
+    """Add `n` days to a `YYYY-MM-DD` string and return the same shape.
+
+    The tools only ever need "this date plus a day" to build an exclusive
+    range end, which doesn't justify strptime's format-code interpreter;
+    slicing the three fields and letting `date` do the carry is an order
+    of magnitude cheaper. Falls back to strptime for off-shape input so
+    validation errors read the same as before.
+    """
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            shifted = date(int(s[0:4]), int(s[5:7]), int(s[8:10])) + timedelta(days=n)
+            return f"{shifted.year:04d}-{shifted.month:02d}-{shifted.day:02d}"
+        except ValueError:
+            pass
+    shifted = (datetime.strptime(s, "%Y-%m-%d") + timedelta(days=n)).date()
+    return f"{shifted.year:04d}-{shifted.month:02d}-{shifted.day:02d}"
+
+
+def _fast_fmt_iso(dt_str: str, with_date: bool) -> str | None:
+    """Format an RFC3339 timestamp without datetime/strftime.
+
+    format_event runs once per event, and a 90-day listing can hold
+    hundreds of events — two fromisoformat parses plus two strftime
+    calls each. Google's timestamps have a fixed shape, so the fields
+    can be sliced straight out of the string. Returns the same text as
+    ``strftime('%I:%M %p %Z')`` (date-prefixed when `with_date`), or
+    None when the string doesn't match the expected shape and the
+    caller should fall back to the datetime path.
+    """
+    if (
+        len(dt_str) < 19
+        or dt_str[4] != "-"
+        or dt_str[7] != "-"
+        or dt_str[10] != "T"
+        or dt_str[13] != ":"
+        or dt_str[16] != ":"
+    ):
+        return None
+    hh = dt_str[11:13]
+    mm = dt_str[14:16]
+    if not (hh.isdigit() and mm.isdigit()):
+        return None
+
+    # %Z for the fixed-offset tzinfo fromisoformat would have produced.
+    offset = dt_str[19:]
+    if not offset:
+        tz_name = ""  # naive input: strftime renders %Z as empty
+    elif offset == "Z" or offset in ("+00:00", "-00:00"):
+        tz_name = "UTC"
+    elif len(offset) == 6 and offset[0] in "+-" and offset[3] == ":":
+        tz_name = f"UTC{offset}"
+    else:
+        return None  # fractional seconds etc. — let datetime handle it
+
+    hour = int(hh)
+    if hour > 23:
+        return None
+    half = "AM" if hour < 12 else "PM"
+    hour12 = hour % 12 or 12
+
+    time_part = f"{hour12:02d}:{mm} {half} {tz_name}"
+    if with_date:
+        return f"{dt_str[:10]} {time_part}"
+    return time_part
+
+
+def _fmt_allday(start: dict, end: dict, summary: str) -> str:
+    """Core line for an all-day event."""
+    date_str = start["date"]
+    end_date = end.get("date", "")
+    if end_date and end_date != date_str:
+        return f"{summary} — {date_str} → {end_date} (all day)"
+    return f"{summary} — {date_str} (all day)"
+
+
+def _fmt_timed(start: dict, end: dict, summary: str) -> str:
+    """Core line for a timed event."""
+    dt_str = start.get("dateTime", "")
+    end_dt_str = end.get("dateTime", "")
+    start_fmt = _fast_fmt_iso(dt_str, with_date=True)
+    if start_fmt is None:
+        try:
+            dt = datetime.fromisoformat(dt_str)
+            start_fmt = dt.strftime("%Y-%m-%d %I:%M %p %Z")
+        except (ValueError, AttributeError):
+            start_fmt = dt_str
+    end_fmt = _fast_fmt_iso(end_dt_str, with_date=False)
+    if end_fmt is None:
+        try:
+            end_dt = datetime.fromisoformat(end_dt_str)
+            end_fmt = end_dt.strftime("%I:%M %p %Z")
+        except (ValueError, AttributeError):
+            end_fmt = end_dt_str
+    return f"{summary} — {start_fmt} to {end_fmt}"
+
 
 class GoogleCalendarHelper:
     """Shared utilities for Google Calendar tools."""
@@ -24,6 +233,29 @@ class GoogleCalendarHelper:
         self.google_service = google_service
         self.user_id = user_id
         self._cached_timezone: str | None = None
+        self._tz_prefetch: asyncio.Task | None = None
+        # Bound once; api_patch/api_delete only concatenate the quoted id.
+        self._event_url_prefix = self.CALENDAR_BASE + "/"
+
+    def start_timezone_prefetch(self) -> None:
+        """Fetch the timezone in the background before any tool needs it.
+
+        Scheduling tools all resolve the timezone eventually; starting
+        the settings request while the agent is still picking a tool
+        hides the round-trip behind the model's thinking time. No-op
+        when the timezone is already cached or no event loop is running.
+        """
+        if (
+            self._cached_timezone
+            or self.user_id in _TZ_CACHE
+            or self._tz_prefetch is not None
+        ):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # built outside a loop; the first tool call fetches
+        self._tz_prefetch = loop.create_task(self._fetch_user_timezone())
 
     async def get_user_timezone(self) -> str:
         """Fetch the user's timezone from Google Calendar settings.
@@ -33,6 +265,19 @@ class GoogleCalendarHelper:
         """
         if self._cached_timezone:
             return self._cached_timezone
+        cached = _TZ_CACHE.get(self.user_id)
+        if cached is not None:
+            self._cached_timezone = cached
+            return cached
+        task = self._tz_prefetch
+        if task is not None:
+            # Consume the prefetch; if it failed the next call retries.
+            self._tz_prefetch = None
+            return await task
+        return await self._fetch_user_timezone()
+
+    async def _fetch_user_timezone(self) -> str:
+        """Issue the settings request and populate both caches."""
         try:
             response = await self.google_service.make_google_request(
                 user_id=self.user_id,
@@ -41,16 +286,27 @@ class GoogleCalendarHelper:
             )
             tz = response.get("value", "America/New_York")
             self._cached_timezone = tz
+            _TZ_CACHE[self.user_id] = tz
             return tz
         except Exception as e:
             _logger.warning("Failed to fetch user timezone: %s", e)
             return "America/New_York"
 
-    async def resolve_timezone(self, provided_tz: str | None) -> str:
-        """Use provided timezone or auto-detect from Google Calendar."""
+    def resolve_timezone_fast(self, provided_tz: str | None) -> str | None:
+        """Resolve the timezone without touching the event loop.
+
+        Returns the explicit timezone, or the cached one when already
+        known, or None when only the async fetch can answer — callers do
+        ``helper.resolve_timezone_fast(tz) or await helper.get_user_timezone()``
+        so the common explicit/cached case skips the coroutine round-trip.
+        """
         if provided_tz and provided_tz != "auto":
             return provided_tz
-        return await self.get_user_timezone()
+        return self._cached_timezone or _TZ_CACHE.get(self.user_id)
+
+    async def resolve_timezone(self, provided_tz: str | None) -> str:
+        """Use provided timezone or auto-detect from Google Calendar."""
+        return self.resolve_timezone_fast(provided_tz) or await self.get_user_timezone()
 
     async def api_get(
         self,
@@ -82,13 +338,39 @@ class GoogleCalendarHelper:
             params=params,
         )
 
+    async def api_batch_post(self, bodies: list[dict]) -> list[dict | Exception]:
+        """POST many event bodies as one multipart batch request.
+
+        Collapses N event creations into a single HTTPS round-trip via
+        Google's batch endpoint; responses come back in submission order,
+        with per-part failures in-place as exceptions (like api_post_many).
+        """
+        return await self.google_service.make_google_batch_request(
+            user_id=self.user_id,
+            endpoint=self.CALENDAR_BASE,
+            bodies=bodies,
+        )
+
+    async def api_post_many(self, bodies: list[dict]) -> list[dict | Exception]:
+        """POST several independent bodies concurrently.
+
+        Fallback for when the batch endpoint can't be used: the requests
+        still overlap on the wire, so wall time is ~max(RTT) rather than
+        sum(RTT). Failures come back in-place as exceptions instead of
+        aborting the rest.
+        """
+        return await asyncio.gather(
+            *(self.api_post(data=body) for body in bodies),
+            return_exceptions=True,
+        )
+
     async def api_patch(
         self,
         event_id: str,
         data: dict,
     ) -> dict:
         """PATCH request to update an event."""
-        endpoint = f"{self.CALENDAR_BASE}/{event_id}"
+        endpoint = self._event_url_prefix + quote(event_id, safe="")
         return await self.google_service.make_google_request(
             user_id=self.user_id,
             method="PATCH",
@@ -98,7 +380,7 @@ class GoogleCalendarHelper:
 
     async def api_delete(self, event_id: str) -> dict:
         """DELETE request to remove an event."""
-        endpoint = f"{self.CALENDAR_BASE}/{event_id}"
+        endpoint = self._event_url_prefix + quote(event_id, safe="")
         return await self.google_service.make_google_request(
             user_id=self.user_id,
             method="DELETE",
@@ -108,34 +390,16 @@ class GoogleCalendarHelper:
     @staticmethod
     def format_event(event: dict) -> str:
         """Format a single event into a human-readable line."""
-        summary = event.get("summary", "No title")
-        start = event.get("start", {})
-        end = event.get("end", {})
-        location = event.get("location", "")
-        status = event.get("status", "")
-        event_id = event.get("id", "")
-
-        if "date" in start:
-            date_str = start["date"]
-            end_date = end.get("date", "")
-            if end_date and end_date != date_str:
-                line = f"{summary} — {date_str} → {end_date} (all day)"
-            else:
-                line = f"{summary} — {date_str} (all day)"
-        else:
-            dt_str = start.get("dateTime", "")
-            end_dt_str = end.get("dateTime", "")
-            try:
-                dt = datetime.fromisoformat(dt_str)
-                start_fmt = dt.strftime("%Y-%m-%d %I:%M %p %Z")
-            except (ValueError, AttributeError):
-                start_fmt = dt_str
-            try:
-                end_dt = datetime.fromisoformat(end_dt_str)
-                end_fmt = end_dt.strftime("%I:%M %p %Z")
-            except (ValueError, AttributeError):
-                end_fmt = end_dt_str
-            line = f"{summary} — {start_fmt} to {end_fmt}"
+        get = event.get  # bound once — six lookups per event below
+        summary = get("summary", "No title")
+        start = get("start", {})
+        end = get("end", {})
+        location = get("location", "")
+        status = get("status", "")
+        event_id = get("id", "")
+
+        # Two-way dispatch keeps the per-kind bodies straight-line code.
+        line = (_fmt_allday if "date" in start else _fmt_timed)(start, end, summary)
 
         if location:
             line += f" | 📍 {location}"
@@ -150,10 +414,11 @@ class GoogleCalendarHelper:
         """Format a list of events with a header."""
         if not events:
             return f"{header}\nNo events found."
-        lines = [f"{header}\n"]
-        for event in events:
-            lines.append(GoogleCalendarHelper.format_event(event))
-        return "\n".join(lines)
+        # map() hands join an iterator over format_event directly — no
+        # interpreter-level append loop, no intermediate list growth.
+        return (
+            header + "\n\n" + "\n".join(map(GoogleCalendarHelper.format_event, events))
+        )
 
 
 def create_google_calendar_tools(google_service, user_id: str) -> list:
@@ -166,7 +431,14 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
     Returns:
         List of LangChain tools for Google Calendar operations
     """
+    cache_key = (id(google_service), user_id)
+    cached = _TOOLS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     helper = GoogleCalendarHelper(google_service, user_id)
+    # Warm the timezone while the agent decides which tool to call.
+    helper.start_timezone_prefetch()
 
     @tool("get_user_timezone")
     async def get_user_timezone() -> str:
@@ -191,7 +463,7 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
                 f"explicitly requests a different one."
             )
         except Exception as e:
-            _logger.error("get_user_timezone failed: %s", e, exc_info=True)
+            _logger.exception("get_user_timezone failed: %s", e)
             return f"❌ Failed to detect timezone: {e}"
 
     @tool("get_current_datetime_info")
@@ -217,49 +489,39 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
         """
         try:
             tz_name = await helper.get_user_timezone()
+            # One snapshot for the whole response — every date below is
+            # derived from it, so today's string never disagrees with
+            # the weekly tables.
             now_utc = datetime.now(timezone.utc)
-
             weekday = now_utc.weekday()
-            days_names = [
-                "Monday",
-                "Tuesday",
-                "Wednesday",
-                "Thursday",
-                "Friday",
-                "Saturday",
-                "Sunday",
+            today = _ymd(now_utc)
+
+            remaining_days = [
+                f"  {_DAY_NAMES[(weekday + i) % 7]}: "
+                f"{_ymd(now_utc + timedelta(days=i))}"
+                for i in range(7 - weekday)
             ]
-            today_name = days_names[weekday]
-
-            remaining_days = []
-            for i in range(7 - weekday):
-                future = now_utc + timedelta(days=i)
-                remaining_days.append(
-                    f"  {days_names[(weekday + i) % 7]}: "
-                    f"{future.strftime('%Y-%m-%d')}"
-                )
 
             next_week_start = now_utc + timedelta(days=(7 - weekday))
-            next_week_days = []
-            for i in range(7):
-                future = next_week_start + timedelta(days=i)
-                next_week_days.append(
-                    f"  {days_names[i]}: {future.strftime('%Y-%m-%d')}"
-                )
+            next_week_days = [
+                f"  {_DAY_NAMES[i]}: {_ymd(next_week_start + timedelta(days=i))}"
+                for i in range(7)
+            ]
 
             return (
-                f"Current UTC time: {now_utc.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"Current UTC time: {today} "
+                f"{now_utc.hour:02d}:{now_utc.minute:02d}:{now_utc.second:02d}\n"
                 f"User's timezone: {tz_name}\n"
-                f"Today is: {today_name}\n\n"
+                f"Today is: {_DAY_NAMES[weekday]}\n\n"
                 f"Remaining days THIS week (including today):\n"
                 + "\n".join(remaining_days)
-                + f"\n\nNext week:\n"
+                + "\n\nNext week:\n"
                 + "\n".join(next_week_days)
-                + f"\n\nIMPORTANT: Always use dates from {now_utc.strftime('%Y-%m-%d')} "
+                + f"\n\nIMPORTANT: Always use dates from {today} "
                 f"onwards. NEVER schedule events in the past."
             )
         except Exception as e:
-            _logger.error("get_current_datetime_info failed: %s", e, exc_info=True)
+            _logger.exception("get_current_datetime_info failed: %s", e)
             return f"❌ Failed to get current datetime: {e}"
 
     @tool("list_upcoming_events")
@@ -285,24 +547,26 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
         """
         try:
             days = min(max(days, 1), 90)
-            time_min = datetime.now(timezone.utc).isoformat()
-            time_max = (datetime.now(timezone.utc) + timedelta(days=days)).isoformat()
-
-            params = {
-                "timeMin": time_min,
-                "timeMax": time_max,
-                "singleEvents": "true",
-                "orderBy": "startTime",
-                "maxResults": str(max_results),
-            }
-
-            response = await helper.api_get(params=params)
+            # One snapshot, second precision — sub-second digits only
+            # bloat the query string, and two now() calls could straddle
+            # a tick.
+            now = datetime.now(timezone.utc)
+            time_min = _utc_isoformat(now)
+            time_max = _utc_isoformat(now + timedelta(days=days))
+
+            endpoint = (
+                f"{helper.CALENDAR_BASE}{_LIST_QUERY_PREFIX}"
+                f"&maxResults={max_results}"
+                f"&timeMin={quote(time_min, safe='')}"
+                f"&timeMax={quote(time_max, safe='')}"
+            )
+            response = await helper.api_get(endpoint)
             events = response.get("items", [])
             return helper.format_event_list(
                 events, f"Upcoming events (next {days} days):"
             )
         except Exception as e:
-            _logger.error("list_upcoming_events failed: %s", e, exc_info=True)
+            _logger.exception("list_upcoming_events failed: %s", e)
             return f"❌ Failed to retrieve calendar events: {e}"
 
     @tool("get_events_for_date")
@@ -326,23 +590,18 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
         """
         try:
             start = f"{date}T00:00:00Z"
-            end_date = (
-                datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)
-            ).strftime("%Y-%m-%d")
-            end = f"{end_date}T00:00:00Z"
-
-            params = {
-                "timeMin": start,
-                "timeMax": end,
-                "singleEvents": "true",
-                "orderBy": "startTime",
-            }
+            end = f"{_add_days_to_yyyy_mm_dd(date, 1)}T00:00:00Z"
 
-            response = await helper.api_get(params=params)
+            endpoint = (
+                f"{helper.CALENDAR_BASE}{_LIST_QUERY_PREFIX}"
+                f"&timeMin={quote(start, safe='')}"
+                f"&timeMax={quote(end, safe='')}"
+            )
+            response = await helper.api_get(endpoint)
             events = response.get("items", [])
             return helper.format_event_list(events, f"Events on {date}:")
         except Exception as e:
-            _logger.error("get_events_for_date failed: %s", e, exc_info=True)
+            _logger.exception("get_events_for_date failed: %s", e)
             return f"❌ Failed to retrieve events for {date}: {e}"
 
     @tool("search_events")
@@ -365,18 +624,16 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             List of matching events with dates, times, and event IDs.
         """
         try:
-            params = {
-                "q": query,
-                "singleEvents": "true",
-                "orderBy": "startTime",
-                "maxResults": str(max_results),
-            }
-
-            response = await helper.api_get(params=params)
+            endpoint = (
+                f"{helper.CALENDAR_BASE}{_LIST_QUERY_PREFIX}"
+                f"&maxResults={max_results}"
+                f"&q={quote(query, safe='')}"
+            )
+            response = await helper.api_get(endpoint)
             events = response.get("items", [])
             return helper.format_event_list(events, f"Events matching '{query}':")
         except Exception as e:
-            _logger.error("search_events failed: %s", e, exc_info=True)
+            _logger.exception("search_events failed: %s", e)
             return f"❌ Failed to search events: {e}"
 
     @tool("create_calendar_event")
@@ -424,7 +681,9 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             Confirmation with event link and ID.
         """
         try:
-            tz = await helper.resolve_timezone(timezone_str)
+            tz = helper.resolve_timezone_fast(
+                timezone_str
+            ) or await helper.get_user_timezone()
 
             event_body: dict = {
                 "summary": title,
@@ -438,10 +697,7 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
                 },
                 "reminders": {
                     "useDefault": False,
-                    "overrides": [
-                        {"method": "popup", "minutes": 1440},
-                        {"method": "popup", "minutes": 60},
-                    ],
+                    "overrides": list(_EVENT_REMINDERS),
                 },
             }
 
@@ -454,18 +710,22 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             event_link = response.get("htmlLink", "")
             event_id = response.get("id", "")
 
-            return (
-                f"Event created successfully!\n"
-                f"Title: {title}\n"
-                f"Start: {start_datetime} ({tz})\n"
-                f"End: {end_datetime} ({tz})\n"
-                + (f"Description: {description}\n" if description else "")
-                + (f"Location: {location}\n" if location else "")
-                + (f"Link: {event_link}\n" if event_link else "")
-                + f"Event ID: {event_id}"
-            )
+            parts = [
+                "Event created successfully!",
+                f"Title: {title}",
+                f"Start: {start_datetime} ({tz})",
+                f"End: {end_datetime} ({tz})",
+            ]
+            if description:
+                parts.append(f"Description: {description}")
+            if location:
+                parts.append(f"Location: {location}")
+            if event_link:
+                parts.append(f"Link: {event_link}")
+            parts.append(f"Event ID: {event_id}")
+            return "\n".join(parts)
         except Exception as e:
-            _logger.error("create_calendar_event failed: %s", e, exc_info=True)
+            _logger.exception("create_calendar_event failed: %s", e)
             return f"❌ Failed to create calendar event: {e}"
 
     @tool("create_all_day_event")
@@ -499,8 +759,7 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
         """
         try:
             if not end_date:
-                end_dt = datetime.strptime(start_date, "%Y-%m-%d") + timedelta(days=1)
-                end_date = end_dt.strftime("%Y-%m-%d")
+                end_date = _add_days_to_yyyy_mm_dd(start_date, 1)
 
             event_body: dict = {
                 "summary": title,
@@ -508,9 +767,7 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
                 "end": {"date": end_date},
                 "reminders": {
                     "useDefault": False,
-                    "overrides": [
-                        {"method": "popup", "minutes": 1440},
-                    ],
+                    "overrides": list(_ALL_DAY_REMINDERS),
                 },
             }
 
@@ -523,17 +780,21 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             event_link = response.get("htmlLink", "")
             event_id = response.get("id", "")
 
-            return (
-                f"All-day event created!\n"
-                f"Title: {title}\n"
-                f"Date: {start_date}\n"
-                + (f"Description: {description}\n" if description else "")
-                + (f"Location: {location}\n" if location else "")
-                + (f"Link: {event_link}\n" if event_link else "")
-                + f"Event ID: {event_id}"
-            )
+            parts = [
+                "All-day event created!",
+                f"Title: {title}",
+                f"Date: {start_date}",
+            ]
+            if description:
+                parts.append(f"Description: {description}")
+            if location:
+                parts.append(f"Location: {location}")
+            if event_link:
+                parts.append(f"Link: {event_link}")
+            parts.append(f"Event ID: {event_id}")
+            return "\n".join(parts)
         except Exception as e:
-            _logger.error("create_all_day_event failed: %s", e, exc_info=True)
+            _logger.exception("create_all_day_event failed: %s", e)
             return f"❌ Failed to create all-day event: {e}"
 
     @tool("schedule_assignment_due_date")
@@ -572,7 +833,9 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             Confirmation with event link and ID.
         """
         try:
-            tz = await helper.resolve_timezone(timezone_str)
+            tz = helper.resolve_timezone_fast(
+                timezone_str
+            ) or await helper.get_user_timezone()
             due_dt = datetime.fromisoformat(due_datetime)
             start_dt = due_dt - timedelta(minutes=30)
 
@@ -593,10 +856,7 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
                 "colorId": "11",
                 "reminders": {
                     "useDefault": False,
-                    "overrides": [
-                        {"method": "popup", "minutes": 60},
-                        {"method": "popup", "minutes": 1440},
-                    ],
+                    "overrides": list(_ASSIGNMENT_REMINDERS),
                 },
             }
 
@@ -607,16 +867,19 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             event_link = response.get("htmlLink", "")
             event_id = response.get("id", "")
 
-            return (
-                f"Assignment due date scheduled!\n"
-                f"Title: {summary}\n"
-                f"Due: {due_datetime} ({tz})\n"
-                + (f"Description: {description}\n" if description else "")
-                + (f"Link: {event_link}\n" if event_link else "")
-                + f"Event ID: {event_id}"
-            )
+            parts = [
+                "Assignment due date scheduled!",
+                f"Title: {summary}",
+                f"Due: {due_datetime} ({tz})",
+            ]
+            if description:
+                parts.append(f"Description: {description}")
+            if event_link:
+                parts.append(f"Link: {event_link}")
+            parts.append(f"Event ID: {event_id}")
+            return "\n".join(parts)
         except Exception as e:
-            _logger.error("schedule_assignment_due_date failed: %s", e, exc_info=True)
+            _logger.exception("schedule_assignment_due_date failed: %s", e)
             return f"❌ Failed to schedule assignment: {e}"
 
     @tool("schedule_study_session")
@@ -665,7 +928,9 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             Confirmation with event link and ID.
         """
         try:
-            tz = await helper.resolve_timezone(timezone_str)
+            tz = helper.resolve_timezone_fast(
+                timezone_str
+            ) or await helper.get_user_timezone()
             start_dt = datetime.fromisoformat(start_datetime)
             end_dt = start_dt + timedelta(hours=duration_hours)
 
@@ -686,10 +951,7 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
                 "colorId": "9",
                 "reminders": {
                     "useDefault": False,
-                    "overrides": [
-                        {"method": "email", "minutes": 1440},
-                        {"method": "popup", "minutes": 60},
-                    ],
+                    "overrides": list(_STUDY_REMINDERS),
                 },
             }
 
@@ -700,19 +962,278 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             event_link = response.get("htmlLink", "")
             event_id = response.get("id", "")
 
-            return (
-                f"Study session scheduled!\n"
-                f"Title: {summary}\n"
-                f"Start: {start_datetime} ({tz})\n"
-                f"Duration: {duration_hours}h\n"
-                + (f"Description: {description}\n" if description else "")
-                + (f"Link: {event_link}\n" if event_link else "")
-                + f"Event ID: {event_id}"
-            )
+            parts = [
+                "Study session scheduled!",
+                f"Title: {summary}",
+                f"Start: {start_datetime} ({tz})",
+                f"Duration: {duration_hours}h",
+            ]
+            if description:
+                parts.append(f"Description: {description}")
+            if event_link:
+                parts.append(f"Link: {event_link}")
+            parts.append(f"Event ID: {event_id}")
+            return "\n".join(parts)
         except Exception as e:
-            _logger.error("schedule_study_session failed: %s", e, exc_info=True)
+            _logger.exception("schedule_study_session failed: %s", e)
             return f"❌ Failed to schedule study session: {e}"
 
+    @tool("create_calendar_events_bulk")
+    async def create_calendar_events_bulk(
+        events: list[dict],
+        timezone_str: str = "auto",
+    ) -> str:
+        """Create SEVERAL timed calendar events in ONE batched request.
+
+        Much faster than calling create_calendar_event repeatedly — all
+        events go to Google in a single round-trip. Prefer this whenever
+        the user wants more than one event created.
+
+        Use when the user asks:
+        - "Add all three meetings to my calendar"
+        - "Schedule my classes for the week"
+        - "Create events for every item on this list"
+
+        Args:
+            events: List of event dicts, each with keys:
+                - title: Event title (required)
+                - start_datetime: Start in ISO format, e.g. '2026-02-14T10:00:00' (required)
+                - end_datetime: End in ISO format (required)
+                - description: Optional description
+                - location: Optional location
+            timezone_str: IANA timezone or 'auto' to detect (default: 'auto')
+
+        Returns:
+            Confirmation listing each created event with its ID.
+        """
+        try:
+            if not events:
+                return "No events provided."
+
+            tz = helper.resolve_timezone_fast(
+                timezone_str
+            ) or await helper.get_user_timezone()
+
+            bodies = []
+            for spec in events:
+                event_body: dict = {
+                    "summary": spec.get("title", "Untitled"),
+                    "start": {
+                        "dateTime": spec.get("start_datetime"),
+                        "timeZone": tz,
+                    },
+                    "end": {
+                        "dateTime": spec.get("end_datetime"),
+                        "timeZone": tz,
+                    },
+                    "reminders": {
+                        "useDefault": False,
+                        "overrides": list(_EVENT_REMINDERS),
+                    },
+                }
+                if spec.get("description"):
+                    event_body["description"] = spec["description"]
+                if spec.get("location"):
+                    event_body["location"] = spec["location"]
+                bodies.append(event_body)
+
+            created = await helper.api_batch_post(bodies)
+
+            lines = [f"Created calendar events ({tz}):"]
+            failures = 0
+            for spec, response in zip(events, created):
+                if isinstance(response, Exception):
+                    failures += 1
+                    lines.append(
+                        f"  • {spec.get('title', 'Untitled')} — "
+                        f"❌ failed: {response}"
+                    )
+                else:
+                    lines.append(
+                        f"  • {spec.get('title', 'Untitled')} — "
+                        f"{spec.get('start_datetime', '')}"
+                        f"  (id: {response.get('id', '')})"
+                    )
+            if failures:
+                lines.append(f"\n{failures} of {len(events)} events failed.")
+            return "\n".join(lines)
+        except Exception as e:
+            _logger.exception("create_calendar_events_bulk failed: %s", e)
+            return f"❌ Failed to create calendar events: {e}"
+
+    @tool("schedule_assignment_due_dates_bulk")
+    async def schedule_assignment_due_dates_bulk(
+        assignments: list[dict],
+        timezone_str: str = "auto",
+    ) -> str:
+        """Schedule SEVERAL assignment due dates in ONE batched request.
+
+        Batched variant of schedule_assignment_due_date: every deadline is
+        sent to Google in a single round-trip, each as a 30-minute event
+        ending at the due time with 24h and 1h reminders.
+
+        Use when the user asks:
+        - "Put all my assignment deadlines on my calendar"
+        - "Add every due date from CS497 to Google Calendar"
+
+        Args:
+            assignments: List of assignment dicts, each with keys:
+                - title: Assignment title (required)
+                - due_datetime: Due date/time in ISO format (required)
+                - course_name: Optional course name to prefix the title
+                - description: Optional description
+            timezone_str: IANA timezone or 'auto' to detect (default: 'auto')
+
+        Returns:
+            Confirmation listing each scheduled deadline with its ID.
+        """
+        try:
+            if not assignments:
+                return "No assignments provided."
+
+            tz = helper.resolve_timezone_fast(
+                timezone_str
+            ) or await helper.get_user_timezone()
+
+            bodies = []
+            summaries = []
+            for spec in assignments:
+                due_dt = datetime.fromisoformat(spec["due_datetime"])
+                start_dt = due_dt - timedelta(minutes=30)
+
+                summary = f"DUE: {spec.get('title', 'Assignment')}"
+                if spec.get("course_name"):
+                    summary = f"[{spec['course_name']}] {summary}"
+                summaries.append(summary)
+
+                event_body: dict = {
+                    "summary": summary,
+                    "start": {
+                        "dateTime": start_dt.isoformat(),
+                        "timeZone": tz,
+                    },
+                    "end": {
+                        "dateTime": due_dt.isoformat(),
+                        "timeZone": tz,
+                    },
+                    "colorId": "11",
+                    "reminders": {
+                        "useDefault": False,
+                        "overrides": list(_ASSIGNMENT_REMINDERS),
+                    },
+                }
+                if spec.get("description"):
+                    event_body["description"] = spec["description"]
+                bodies.append(event_body)
+
+            created = await helper.api_batch_post(bodies)
+
+            lines = [f"Scheduled assignment due dates ({tz}):"]
+            failures = 0
+            for spec, summary, response in zip(assignments, summaries, created):
+                if isinstance(response, Exception):
+                    failures += 1
+                    lines.append(f"  • {summary} — ❌ failed: {response}")
+                else:
+                    lines.append(
+                        f"  • {summary} — due {spec.get('due_datetime', '')}"
+                        f"  (id: {response.get('id', '')})"
+                    )
+            if failures:
+                lines.append(
+                    f"\n{failures} of {len(assignments)} due dates failed."
+                )
+            return "\n".join(lines)
+        except Exception as e:
+            _logger.exception(
+                "schedule_assignment_due_dates_bulk failed: %s", e)
+            return f"❌ Failed to schedule assignment due dates: {e}"
+
+    @tool("schedule_study_sessions_bulk")
+    async def schedule_study_sessions_bulk(
+        sessions: list[dict],
+        timezone_str: str = "auto",
+    ) -> str:
+        """Schedule SEVERAL study sessions at once, firing the requests
+        concurrently instead of one at a time.
+
+        Use when the user asks:
+        - "Block out study time every evening this week"
+        - "Schedule all the sessions from this study plan"
+
+        Args:
+            sessions: List of session dicts, each with keys:
+                - title: Study topic or assignment name (required)
+                - start_datetime: Start in ISO format (required)
+                - duration_hours: Duration in hours (default: 1.0)
+                - course_name: Optional course name to prefix the title
+                - description: Optional study plan or topics
+            timezone_str: IANA timezone or 'auto' to detect (default: 'auto')
+
+        Returns:
+            Confirmation listing each scheduled session with its ID.
+        """
+        try:
+            if not sessions:
+                return "No sessions provided."
+
+            tz = helper.resolve_timezone_fast(
+                timezone_str
+            ) or await helper.get_user_timezone()
+
+            bodies = []
+            summaries = []
+            for spec in sessions:
+                start_dt = datetime.fromisoformat(spec["start_datetime"])
+                end_dt = start_dt + timedelta(
+                    hours=spec.get("duration_hours", 1.0)
+                )
+
+                summary = f"Study: {spec.get('title', 'Study session')}"
+                if spec.get("course_name"):
+                    summary = f"[{spec['course_name']}] {summary}"
+                summaries.append(summary)
+
+                event_body: dict = {
+                    "summary": summary,
+                    "start": {
+                        "dateTime": start_dt.isoformat(),
+                        "timeZone": tz,
+                    },
+                    "end": {
+                        "dateTime": end_dt.isoformat(),
+                        "timeZone": tz,
+                    },
+                    "colorId": "9",
+                    "reminders": {
+                        "useDefault": False,
+                        "overrides": list(_STUDY_REMINDERS),
+                    },
+                }
+                if spec.get("description"):
+                    event_body["description"] = spec["description"]
+                bodies.append(event_body)
+
+            results = await helper.api_post_many(bodies)
+
+            lines = [f"Scheduled study sessions ({tz}):"]
+            failures = 0
+            for spec, summary, result in zip(sessions, summaries, results):
+                if isinstance(result, Exception):
+                    failures += 1
+                    lines.append(f"  • {summary} — ❌ failed: {result}")
+                else:
+                    lines.append(
+                        f"  • {summary} — {spec.get('start_datetime', '')}"
+                        f"  (id: {result.get('id', '')})"
+                    )
+            if failures:
+                lines.append(f"\n{failures} of {len(sessions)} sessions failed.")
+            return "\n".join(lines)
+        except Exception as e:
+            _logger.exception("schedule_study_sessions_bulk failed: %s", e)
+            return f"❌ Failed to schedule study sessions: {e}"
+
     @tool("update_calendar_event")
     async def update_calendar_event(
         event_id: str,
@@ -778,7 +1299,7 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
                 f"Event '{updated_summary}' updated successfully! " f"(ID: {event_id})"
             )
         except Exception as e:
-            _logger.error("update_calendar_event failed: %s", e, exc_info=True)
+            _logger.exception("update_calendar_event failed: %s", e)
             return f"❌ Failed to update event: {e}"
 
     @tool("delete_calendar_event")
@@ -807,7 +1328,7 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             await helper.api_delete(event_id)
             return f"✅ Event deleted successfully! (ID: {event_id})"
         except Exception as e:
-            _logger.error("delete_calendar_event failed: %s", e, exc_info=True)
+            _logger.exception("delete_calendar_event failed: %s", e)
             return f"❌ Failed to delete event: {e}"
 
     @tool("check_availability")
@@ -836,21 +1357,23 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             - List of free time slots with durations
         """
         try:
-            time_min = f"{date}T{start_hour:02d}:00:00Z"
-            end_date = (
-                date
-                if end_hour < 24
-                else (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)).strftime(
-                    "%Y-%m-%d"
-                )
+            # One strptime up front; end_hour=24 becomes a plain day offset
+            # (end_hour // 24) instead of a conditional reparse-and-reformat
+            # of the date string. The bounds are built UTC-aware and every
+            # event timestamp is normalized into UTC below, so the merge
+            # runs in a single zone and they double as its window.
+            base = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            window_start = base.replace(hour=start_hour)
+            window_end = base.replace(hour=end_hour % 24) + timedelta(
+                days=end_hour // 24
             )
-            time_max = f"{end_date}T{end_hour % 24:02d}:00:00Z"
+            time_min = _utc_isoformat(window_start)
+            time_max = _utc_isoformat(window_end)
 
             params = {
+                **_CALENDAR_STATIC_PARAMS,
                 "timeMin": time_min,
                 "timeMax": time_max,
-                "singleEvents": "true",
-                "orderBy": "startTime",
             }
 
             response = await helper.api_get(params=params)
@@ -862,54 +1385,66 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
                     f"between {start_hour:02d}:00 and {end_hour:02d}:00!"
                 )
 
+            # The API already returns events in startTime order
+            # (orderBy=startTime), so busy and free slots come out of one
+            # linear merge pass — no extra sort, and the running cursor
+            # only ever moves forward.
+            cursor = window_start
+
             busy_slots = []
+            free_slots = []
+            # Bound once for the loop: itemgetter pulls all three fields in
+            # one C call, and the method lookups don't repeat per event.
+            _fromiso = datetime.fromisoformat
+            add_busy = busy_slots.append
+            add_free = free_slots.append
             for event in events:
-                start = event.get("start", {})
-                end = event.get("end", {})
-                summary = event.get("summary", "Busy")
-
-                if "dateTime" in start:
-                    s = datetime.fromisoformat(start["dateTime"])
-                    e = datetime.fromisoformat(end["dateTime"])
-                    busy_slots.append((s, e, summary))
-
-            lines = [
-                f"Schedule for {date} " f"({start_hour:02d}:00–{end_hour:02d}:00):\n"
-            ]
-            lines.append("Busy slots:")
-            for s, e, name in busy_slots:
-                lines.append(
-                    f"{s.strftime('%I:%M %p')} – " f"{e.strftime('%I:%M %p')}: {name}"
-                )
-
-            if busy_slots:
-                busy_sorted = sorted(busy_slots, key=lambda x: x[0])
-                free_slots = []
-                window_start = datetime.fromisoformat(f"{date}T{start_hour:02d}:00:00")
-                for s, e, _ in busy_sorted:
-                    if s > window_start:
-                        free_slots.append((window_start, s))
-                    window_start = max(window_start, e)
-                window_end = datetime.fromisoformat(
-                    f"{end_date}T{end_hour % 24:02d}:00:00"
-                )
-                if window_start < window_end:
-                    free_slots.append((window_start, window_end))
-
-                if free_slots:
-                    lines.append("\nFree slots:")
-                    for s, e in free_slots:
-                        duration = (e - s).total_seconds() / 3600
-                        lines.append(
-                            f"{s.strftime('%I:%M %p')} – "
-                            f"{e.strftime('%I:%M %p')} ({duration:.1f}h)"
-                        )
-                else:
-                    lines.append("\n No free slots in this window.")
+                try:
+                    start, end, summary = _EVENT_SLOT_FIELDS(event)
+                except KeyError:
+                    start = event.get("start", {})
+                    end = event.get("end", {})
+                    summary = event.get("summary", "Busy")
+                if "dateTime" not in start:
+                    continue
+                # Normalize each event into the window's zone (UTC)
+                # before merging: Google returns calendar-local offsets,
+                # and mixing zones would skew both the printed slot
+                # labels and the computed durations.
+                s = _fromiso(start["dateTime"]).astimezone(timezone.utc)
+                e = _fromiso(end["dateTime"]).astimezone(timezone.utc)
+                add_busy((s, e, summary))
+                if s > cursor:
+                    add_free((cursor, s))
+                if e > cursor:
+                    cursor = e
+            if cursor < window_end:
+                free_slots.append((cursor, window_end))
+
+            prefix = (
+                f"Schedule for {date} "
+                f"({start_hour:02d}:00–{end_hour:02d}:00):\n\nBusy slots:"
+            )
+            if not busy_slots:
+                return prefix
 
-            return "\n".join(lines)
+            busy_block = "\n".join(
+                f"{_HHMM_AMPM[s.hour * 60 + s.minute]} – "
+                f"{_HHMM_AMPM[e.hour * 60 + e.minute]}: {name}"
+                for s, e, name in busy_slots
+            )
+            if not free_slots:
+                return f"{prefix}\n{busy_block}\n\n No free slots in this window."
+
+            free_block = "\n".join(
+                f"{_HHMM_AMPM[s.hour * 60 + s.minute]} – "
+                f"{_HHMM_AMPM[e.hour * 60 + e.minute]} "
+                f"({(e - s).total_seconds() / 3600:.1f}h)"
+                for s, e in free_slots
+            )
+            return f"{prefix}\n{busy_block}\n\nFree slots:\n{free_block}"
         except Exception as e:
-            _logger.error("check_availability failed: %s", e, exc_info=True)
+            _logger.exception("check_availability failed: %s", e)
             return f"❌ Failed to check availability: {e}"
 
     @tool("get_todays_schedule")
@@ -926,28 +1461,24 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
             All events scheduled for today (timed and all-day events).
         """
         try:
-            today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            today, tomorrow = _today_strings(int(time.time()))
             time_min = f"{today}T00:00:00Z"
-            tomorrow = (datetime.now(timezone.utc) + timedelta(days=1)).strftime(
-                "%Y-%m-%d"
-            )
             time_max = f"{tomorrow}T00:00:00Z"
 
             params = {
+                **_CALENDAR_STATIC_PARAMS,
                 "timeMin": time_min,
                 "timeMax": time_max,
-                "singleEvents": "true",
-                "orderBy": "startTime",
             }
 
             response = await helper.api_get(params=params)
             events = response.get("items", [])
             return helper.format_event_list(events, f"Today's schedule ({today}):")
         except Exception as e:
-            _logger.error("get_todays_schedule failed: %s", e, exc_info=True)
+            _logger.exception("get_todays_schedule failed: %s", e)
             return f"❌ Failed to retrieve today's schedule: {e}"
 
-    return [
+    tools = [
         get_user_timezone,
         get_current_datetime_info,
         list_upcoming_events,
@@ -959,6 +1490,11 @@ def create_google_calendar_tools(google_service, user_id: str) -> list:
         create_all_day_event,
         schedule_assignment_due_date,
         schedule_study_session,
+        create_calendar_events_bulk,
+        schedule_assignment_due_dates_bulk,
+        schedule_study_sessions_bulk,
         update_calendar_event,
         delete_calendar_event,
     ]
+    _TOOLS_CACHE[cache_key] = tools
+    return tools
@@ -5,15 +5,113 @@ All content is formatted in clean Markdown which the NotionAPIAdapter
 converts to proper Notion blocks (headings, lists, bold, code, tables, etc.).
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
+from cachetools import TTLCache
 from langchain.tools import tool
 
 _logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _today_human(bucket: int) -> str:
+    """Today as `%B %d, %Y`, memoized per wall-clock second.
+
+    strftime's month-name render goes through a locale lookup; agents that
+    save several pages in one turn hit this within the same second.
+    """
+    del bucket  # only part of the cache key
+    return datetime.now(timezone.utc).strftime("%B %d, %Y")
+
+# Rendered listings per (workspace token, kind). The agent calls
+# get_notion_pages before every page creation to discover parent IDs,
+# and the workspace topology rarely changes within a turn — serving the
+# already-rendered markdown skips the whole round-trip. Creates
+# invalidate the entry so new parents show up immediately.
+_LISTING_CACHE: TTLCache = TTLCache(maxsize=256, ttl=60)
+
+# Built tool lists per workspace token. Re-running the @tool decorators
+# (docstring parse + pydantic schema inference for 7 closures) on every
+# agent turn is pure cold-start cost; same pattern as the calendar and
+# Canvas tool caches.
+_TOOLS_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+# Page-body templates, parsed once at import. The creator tools fill them
+# with a single format_map call instead of re-assembling the markdown from
+# a dozen f-string fragments on every save. Optional sections (points,
+# description) are pre-rendered to "" when absent.
+_STUDY_NOTES_TEMPLATE = (
+    "# {topic}\n\n"
+    "**Course:** {course_name}\n"
+    "**Date:** {today}\n\n"
+    "---\n\n"
+    "{notes_content}"
+)
+
+_ASSIGNMENT_TEMPLATE = (
+    "# {assignment_name}\n\n"
+    "**Course:** {course_name}\n"
+    "**Due Date:** {due_date}\n"
+    "{points_line}"
+    "**Status:** To Do\n\n"
+    "---\n\n"
+    "{desc_section}"
+    "## Progress Checklist\n\n"
+    "- [ ] Review assignment requirements\n"
+    "- [ ] Gather necessary materials / resources\n"
+    "- [ ] Complete first draft\n"
+    "- [ ] Review and revise\n"
+    "- [ ] Submit before deadline\n\n"
+    "## Notes\n\n"
+    "*Add your notes, links, and resources here.*\n"
+)
+
+_STUDY_PLAN_TEMPLATE = (
+    "# {title}\n\n"
+    "**Created:** {today}\n\n"
+    "---\n\n"
+    "## Goals\n\n"
+    "{goals}\n\n"
+    "## Schedule\n\n"
+    "{schedule}\n\n"
+    "## Progress\n\n"
+    "- [ ] Week goals reviewed\n"
+    "- [ ] All study sessions completed\n"
+    "- [ ] Assignments submitted on time\n\n"
+    "## Notes & Reflections\n\n"
+    "*Add reflections at the end of the week.*\n"
+)
+
+
+def _page_entry(i: int, page: dict) -> str:
+    """Render one page as a single pre-formatted block for the listing."""
+    edited = page.get("last_edited", "")
+    url = page.get("url", "")
+    return (
+        f"{i}. **{page.get('title', 'Untitled')}**\n"
+        f"   - ID: `{page.get('id', '')}`"
+        + (f"\n   - Last edited: {edited}" if edited else "")
+        + (f"\n   - [Open in Notion]({url})" if url else "")
+        + "\n"
+    )
+
+
+def _db_entry(i: int, db: dict) -> str:
+    """Render one database as a single pre-formatted block for the listing."""
+    url = db.get("url", "")
+    return (
+        f"{i}. **{db.get('title', 'Untitled')}**\n"
+        f"   - ID: `{db.get('id', '')}`"
+        + (f"\n   - [Open in Notion]({url})" if url else "")
+        + "\n"
+    )
+
+
 def create_notion_tools(notion_repo) -> list:
     """Create Notion tools for the LangChain agent.
 
@@ -23,6 +121,38 @@ def create_notion_tools(notion_repo) -> list:
     Returns:
         List of LangChain tools for Notion operations
     """
+    cache_token = getattr(notion_repo, "access_token", None) or id(notion_repo)
+
+    cached_tools = _TOOLS_CACHE.get(cache_token)
+    if cached_tools is not None:
+        return cached_tools
+
+    # Raw top-level pages from the last real listing fetch. The create_*
+    # docstrings tell the agent to call get_notion_pages first, so when a
+    # creator is invoked without an explicit parent we can resolve one
+    # here instead of letting NotionAPIAdapter.create_page re-fetch the
+    # page list over the wire.
+    _parent_cache: dict = {"pages": None, "ts": 0.0}
+
+    # Last search_notion query and its rendered result. Agents often
+    # re-search the same term within a conversation turn; 30s keeps the
+    # repeat free without hiding fresh workspace changes for long.
+    _search_cache: dict = {"q": None, "result": "", "ts": 0.0}
+
+    def _invalidate_listings() -> None:
+        """Drop cached listings after a create so new pages are visible."""
+        _LISTING_CACHE.pop((cache_token, "pages"), None)
+        _LISTING_CACHE.pop((cache_token, "databases"), None)
+        _parent_cache["pages"] = None
+
+    def _resolve_parent(parent_page_id: Optional[str]) -> Optional[str]:
+        """Fill in a missing parent from the prefetched page list."""
+        if parent_page_id is not None:
+            return parent_page_id
+        pages = _parent_cache["pages"]
+        if pages and time.monotonic() - _parent_cache["ts"] < 300:
+            return pages[0]["id"]
+        return None
 
     @tool("get_notion_pages")
     def get_notion_pages() -> str:
@@ -41,6 +171,10 @@ def create_notion_tools(notion_repo) -> list:
             Numbered list of pages with their IDs and URLs.
         """
         try:
+            cached = _LISTING_CACHE.get((cache_token, "pages"))
+            if cached is not None:
+                return cached
+
             pages = notion_repo.get_top_level_pages(max_results=20)
 
             if not pages:
@@ -49,21 +183,17 @@ def create_notion_tools(notion_repo) -> list:
                     "with the integration from their Notion workspace."
                 )
 
-            lines = ["# Available Notion Pages\n"]
-            for i, page in enumerate(pages, 1):
-                title = page.get("title", "Untitled")
-                page_id = page.get("id", "")
-                url = page.get("url", "")
-                edited = page.get("last_edited", "")
-                lines.append(f"{i}. **{title}**")
-                lines.append(f"   - ID: `{page_id}`")
-                if edited:
-                    lines.append(f"   - Last edited: {edited}")
-                if url:
-                    lines.append(f"   - [Open in Notion]({url})")
-                lines.append("")
-
-            return "\n".join(lines)
+            _parent_cache["pages"] = pages
+            _parent_cache["ts"] = time.monotonic()
+
+            rendered = "\n".join(
+                [
+                    "# Available Notion Pages\n",
+                    *(_page_entry(i, page) for i, page in enumerate(pages, 1)),
+                ]
+            )
+            _LISTING_CACHE[(cache_token, "pages")] = rendered
+            return rendered
 
         except Exception as e:
             _logger.error("get_notion_pages failed: %s", e)
@@ -81,6 +211,10 @@ def create_notion_tools(notion_repo) -> list:
             Numbered list of databases with their IDs and URLs.
         """
         try:
+            cached = _LISTING_CACHE.get((cache_token, "databases"))
+            if cached is not None:
+                return cached
+
             databases = notion_repo.search_databases()
 
             if not databases:
@@ -89,18 +223,14 @@ def create_notion_tools(notion_repo) -> list:
                     "a database or share it with the integration."
                 )
 
-            lines = ["# Available Notion Databases\n"]
-            for i, db in enumerate(databases, 1):
-                title = db.get("title", "Untitled")
-                db_id = db.get("id", "")
-                url = db.get("url", "")
-                lines.append(f"{i}. **{title}**")
-                lines.append(f"   - ID: `{db_id}`")
-                if url:
-                    lines.append(f"   - [Open in Notion]({url})")
-                lines.append("")
-
-            return "\n".join(lines)
+            rendered = "\n".join(
+                [
+                    "# Available Notion Databases\n",
+                    *(_db_entry(i, db) for i, db in enumerate(databases, 1)),
+                ]
+            )
+            _LISTING_CACHE[(cache_token, "databases")] = rendered
+            return rendered
 
         except Exception as e:
             _logger.error("get_notion_databases failed: %s", e)
@@ -147,7 +277,7 @@ def create_notion_tools(notion_repo) -> list:
             result = notion_repo.create_page(
                 title=title,
                 content=content,
-                parent_page_id=parent_page_id,
+                parent_page_id=_resolve_parent(parent_page_id),
             )
 
             if result.get("error"):
@@ -160,6 +290,7 @@ def create_notion_tools(notion_repo) -> list:
                     )
                 return f"❌ Failed to create page: {error}"
 
+            _invalidate_listings()
             page_url = result.get("url", "")
             return f"✅ Notion page created!\n" f"**Title:** {title}\n" + (
                 f"**URL:** {page_url}" if page_url else ""
@@ -206,25 +337,27 @@ def create_notion_tools(notion_repo) -> list:
         """
         try:
             title = f"📝 {course_name} — {topic}"
-            today = datetime.now(timezone.utc).strftime("%B %d, %Y")
-
-            content = (
-                f"# {topic}\n\n"
-                f"**Course:** {course_name}\n"
-                f"**Date:** {today}\n\n"
-                f"---\n\n"
-                f"{notes_content}"
+            today = _today_human(int(time.time()))
+
+            content = _STUDY_NOTES_TEMPLATE.format_map(
+                {
+                    "topic": topic,
+                    "course_name": course_name,
+                    "today": today,
+                    "notes_content": notes_content,
+                }
             )
 
             result = notion_repo.create_page(
                 title=title,
                 content=content,
-                parent_page_id=parent_page_id,
+                parent_page_id=_resolve_parent(parent_page_id),
             )
 
             if result.get("error"):
                 return f"❌ Failed to create study notes: {result['error']}"
 
+            _invalidate_listings()
             page_url = result.get("url", "")
             return (
                 f"Study notes saved to Notion!\n"
@@ -273,36 +406,28 @@ def create_notion_tools(notion_repo) -> list:
         try:
             title = f"{assignment_name} — {course_name}"
 
-            points_line = f"**Points:** {points}\n" if points else ""
-            desc_section = f"## Description\n\n{description}\n\n" if description else ""
-
-            content = (
-                f"# {assignment_name}\n\n"
-                f"**Course:** {course_name}\n"
-                f"**Due Date:** {due_date}\n"
-                f"{points_line}"
-                f"**Status:** To Do\n\n"
-                f"---\n\n"
-                f"{desc_section}"
-                f"## Progress Checklist\n\n"
-                f"- [ ] Review assignment requirements\n"
-                f"- [ ] Gather necessary materials / resources\n"
-                f"- [ ] Complete first draft\n"
-                f"- [ ] Review and revise\n"
-                f"- [ ] Submit before deadline\n\n"
-                f"## Notes\n\n"
-                f"*Add your notes, links, and resources here.*\n"
+            content = _ASSIGNMENT_TEMPLATE.format_map(
+                {
+                    "assignment_name": assignment_name,
+                    "course_name": course_name,
+                    "due_date": due_date,
+                    "points_line": f"**Points:** {points}\n" if points else "",
+                    "desc_section": (
+                        f"## Description\n\n{description}\n\n" if description else ""
+                    ),
+                }
             )
 
             result = notion_repo.create_page(
                 title=title,
                 content=content,
-                parent_page_id=parent_page_id,
+                parent_page_id=_resolve_parent(parent_page_id),
             )
 
             if result.get("error"):
                 return f"❌ Failed to create assignment tracker: {result['error']}"
 
+            _invalidate_listings()
             page_url = result.get("url", "")
             return (
                 f"Assignment tracker created in Notion!\n"
@@ -348,33 +473,27 @@ def create_notion_tools(notion_repo) -> list:
             Confirmation with the Notion page URL.
         """
         try:
-            today = datetime.now(timezone.utc).strftime("%B %d, %Y")
-
-            content = (
-                f"# {title}\n\n"
-                f"**Created:** {today}\n\n"
-                f"---\n\n"
-                f"## Goals\n\n"
-                f"{goals}\n\n"
-                f"## Schedule\n\n"
-                f"{schedule}\n\n"
-                f"## Progress\n\n"
-                f"- [ ] Week goals reviewed\n"
-                f"- [ ] All study sessions completed\n"
-                f"- [ ] Assignments submitted on time\n\n"
-                f"## Notes & Reflections\n\n"
-                f"*Add reflections at the end of the week.*\n"
+            today = _today_human(int(time.time()))
+
+            content = _STUDY_PLAN_TEMPLATE.format_map(
+                {
+                    "title": title,
+                    "today": today,
+                    "goals": goals,
+                    "schedule": schedule,
+                }
             )
 
             result = notion_repo.create_page(
                 title=f"{title}",
                 content=content,
-                parent_page_id=parent_page_id,
+                parent_page_id=_resolve_parent(parent_page_id),
             )
 
             if result.get("error"):
                 return f"❌ Failed to create study plan: {result['error']}"
 
+            _invalidate_listings()
             page_url = result.get("url", "")
             return f"Study plan saved to Notion!\n" f"**Title:** {title}\n" + (
                 f"**URL:** {page_url}" if page_url else ""
@@ -385,7 +504,7 @@ def create_notion_tools(notion_repo) -> list:
             return f"❌ Failed to create study plan: {e}"
 
     @tool("search_notion")
-    def search_notion(query: str) -> str:
+    async def search_notion(query: str) -> str:
         """Search for pages AND databases in the user's Notion workspace by keyword.
 
         Use when the user asks:
@@ -401,11 +520,23 @@ def create_notion_tools(notion_repo) -> list:
             List of matching pages and databases with URLs.
         """
         try:
-            # Use the Notion search API directly (searches titles + content)
-            matching_pages = notion_repo.search_pages(query, max_results=20)
-
-            # Also search databases
-            databases = notion_repo.search_databases(query)
+            query = query.strip()
+            if len(query) < 2:
+                return "Please provide a more specific search query."
+
+            if (
+                _search_cache["q"] == query
+                and time.monotonic() - _search_cache["ts"] < 30
+            ):
+                return _search_cache["result"]
+
+            # The adapter is synchronous (requests-based), so run both
+            # searches in worker threads and await them together — the
+            # page and database lookups are independent round-trips.
+            matching_pages, databases = await asyncio.gather(
+                asyncio.to_thread(notion_repo.search_pages, query, 20),
+                asyncio.to_thread(notion_repo.search_databases, query),
+            )
 
             if not matching_pages and not databases:
                 return f"No results found for '{query}' in Notion."
@@ -435,13 +566,17 @@ def create_notion_tools(notion_repo) -> list:
                         lines.append(f"  [Open in Notion]({url})")
                     lines.append("")
 
-            return "\n".join(lines)
+            rendered = "\n".join(lines)
+            _search_cache["q"] = query
+            _search_cache["result"] = rendered
+            _search_cache["ts"] = time.monotonic()
+            return rendered
 
         except Exception as e:
             _logger.error("search_notion failed: %s", e)
             return f"❌ Failed to search Notion: {e}"
 
-    return [
+    tools = [
         get_notion_pages,
         get_notion_databases,
         create_notion_page,
@@ -450,3 +585,5 @@ def create_notion_tools(notion_repo) -> list:
         create_study_plan_page,
         search_notion,
     ]
+    _TOOLS_CACHE[cache_token] = tools
+    return tools
@@ -1,7 +1,10 @@
 """Azure OpenAI Adapter for interfacing with Azure's OpenAI services."""
 
 import logging
+import time
 from typing import Any, Dict, Optional
+import httpx
+from cachetools import LRUCache
 from langchain_core.callbacks import AsyncCallbackHandler
 from pydantic import SecretStr
 from openai import RateLimitError
@@ -27,6 +30,17 @@ from app.domain.ports.azure import AzureOpenAIPort
 
 _logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexes concurrent completions over one TLS connection, but
+# httpx only enables it when the optional `h2` package is installed.
+try:
+    import h2  # noqa: F401  pylint: disable=unused-import
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+_HTTP_LIMITS = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+
 
 def _log_retry(retry_state: RetryCallState) -> None:
     """Logs a warning when a retry attempt is made."""
@@ -37,26 +51,53 @@ def _log_retry(retry_state: RetryCallState) -> None:
     )
 
 
+# Role → message class, resolved with one dict lookup instead of a chain
+# of comparisons. Unknown roles fall back to HumanMessage as before.
+_ROLE_MAP = {
+    "user": HumanMessage,
+    "assistant": AIMessage,
+    "system": SystemMessage,
+    "tool": ToolMessage,
+}
+
+
 def _to_lc_message(
     msg: Dict[str, str],
 ) -> HumanMessage | AIMessage | SystemMessage | ToolMessage:
-    role = msg["role"]
-    content = msg["content"]
-    if role == "user":
-        return HumanMessage(content=content)
-    if role == "assistant":
-        return AIMessage(content=content)
-    if role == "system":
-        return SystemMessage(content=content)
-    if role == "tool":
-        return ToolMessage(content=content)
-
-    return HumanMessage(content=content)
+    return _ROLE_MAP.get(msg["role"], HumanMessage)(content=msg["content"])
 
 
 class AzureOpenAIAdapter(AzureOpenAIPort):
     """Adapter for Azure OpenAI services."""
 
+    # Shared across adapter instances so every cached AzureChatOpenAI
+    # reuses the same TLS connection pool instead of handshaking per
+    # configuration. Same lifecycle pattern as GoogleService's shared
+    # client: created lazily, closed from the application lifespan.
+    _http_client: Optional[httpx.Client] = None
+    _http_async_client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def _get_http_clients(cls) -> tuple[httpx.Client, httpx.AsyncClient]:
+        """Return the shared sync/async clients, (re)creating if closed."""
+        if cls._http_client is None or cls._http_client.is_closed:
+            cls._http_client = httpx.Client(
+                limits=_HTTP_LIMITS, http2=_HTTP2_AVAILABLE
+            )
+        if cls._http_async_client is None or cls._http_async_client.is_closed:
+            cls._http_async_client = httpx.AsyncClient(
+                limits=_HTTP_LIMITS, http2=_HTTP2_AVAILABLE
+            )
+        return cls._http_client, cls._http_async_client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared HTTP clients (application shutdown)."""
+        if cls._http_client is not None and not cls._http_client.is_closed:
+            cls._http_client.close()
+        if cls._http_async_client is not None and not cls._http_async_client.is_closed:
+            await cls._http_async_client.aclose()
+
     def __init__(
         self,
         *,
@@ -76,7 +117,22 @@ class AzureOpenAIAdapter(AzureOpenAIPort):
         self._default_max_tokens = default_max_tokens
         self._default_timeout = default_timeout
 
-        self._llm_cache: Dict[tuple, AzureChatOpenAI] = {}
+        # True LRU: a lookup refreshes recency, so configurations in
+        # active rotation never get evicted in favor of stale ones the
+        # way the previous insertion-order (FIFO) eviction allowed.
+        self._llm_cache: LRUCache = LRUCache(maxsize=32)
+
+        # Pre-warm the default configuration so the first request doesn't
+        # pay AzureChatOpenAI construction (pydantic validation, client
+        # setup) on its critical path. Construction is local — no network
+        # I/O — but a misconfiguration shouldn't break startup, so any
+        # failure just falls back to lazy creation.
+        try:
+            self._get_or_create_llm(
+                self._default_temperature, self._default_max_tokens, extra={}
+            )
+        except Exception as e:
+            _logger.warning("LLM pre-warm skipped: %s", e)
 
     def chat_completion(
         self, messages: list[Dict[str, Any]], **kwargs
@@ -138,8 +194,6 @@ class AzureOpenAIAdapter(AzureOpenAIPort):
             extra=kwargs,
         )
 
-        full_response = ""
-
         try:
             if tools:
                 agent = create_agent(
@@ -148,12 +202,17 @@ class AzureOpenAIAdapter(AzureOpenAIPort):
                     system_prompt=system_prompt,
                 )
 
-                agent_messages = [
-                    {"role": msg["role"], "content": msg["content"]} for msg in messages
-                ]
+                # Coalesce tokens before waking the callback: one await per
+                # token (~50/s) thrashes the event loop and whatever the
+                # callback bridges to. Flush on ~32 buffered chars or 20ms,
+                # whichever comes first, so perceived latency is unchanged.
+                full_chunks: list[str] = []
+                buf: list[str] = []
+                buf_len = 0
+                last_flush = time.monotonic()
 
                 async for event in agent.astream_events(
-                    {"messages": agent_messages},
+                    {"messages": messages},
                     version="v2",
                 ):
                     kind = event["event"]
@@ -161,8 +220,15 @@ class AzureOpenAIAdapter(AzureOpenAIPort):
                     if kind == "on_chat_model_stream":
                         content = event["data"]["chunk"].content
                         if content:
-                            full_response += content
-                            await callback.on_llm_new_token(content)
+                            full_chunks.append(content)
+                            buf.append(content)
+                            buf_len += len(content)
+                            now = time.monotonic()
+                            if buf_len >= 32 or now - last_flush > 0.02:
+                                await callback.on_llm_new_token("".join(buf))
+                                buf.clear()
+                                buf_len = 0
+                                last_flush = now
 
                     elif kind == "on_tool_start":
                         tool_name = event.get("name", "unknown")
@@ -172,6 +238,10 @@ class AzureOpenAIAdapter(AzureOpenAIPort):
                         tool_name = event.get("name", "unknown")
                         _logger.debug("Tool completed: %s", tool_name)
 
+                if buf:
+                    await callback.on_llm_new_token("".join(buf))
+                full_response = "".join(full_chunks)
+
                 metadata = {
                     "model": self._deployment,
                     "temperature": temperature,
@@ -184,13 +254,22 @@ class AzureOpenAIAdapter(AzureOpenAIPort):
                 lc_messages = []
                 if system_prompt:
                     lc_messages.append(SystemMessage(content=system_prompt))
-                lc_messages.extend([_to_lc_message(msg) for msg in messages])
+                # Inlined dict dispatch: no per-message helper call on the
+                # streaming hot path.
+                lc_messages.extend(
+                    _ROLE_MAP.get(m["role"], HumanMessage)(content=m["content"])
+                    for m in messages
+                )
 
+                # Append-and-join-once: += on an immutable str re-copies the
+                # whole accumulated response for every chunk.
+                full_chunks = []
                 async for chunk in llm.astream(
                     lc_messages, config={"callbacks": [callback]}
                 ):
                     if hasattr(chunk, "content") and chunk.content:
-                        full_response += chunk.content
+                        full_chunks.append(chunk.content)
+                full_response = "".join(full_chunks)
 
                 metadata = {
                     "model": self._deployment,
@@ -225,13 +304,22 @@ class AzureOpenAIAdapter(AzureOpenAIPort):
         """Get or create an LLM instance with caching."""
         tools = extra.get("tools", [])
 
+        # Key on tool identity, not count — two toolsets of the same size
+        # must not share a bound LLM. Floats are normalized so 1 and 1.0
+        # hash to the same entry.
+        tools_key = tuple(
+            getattr(t, "name", None) or getattr(t, "__name__", repr(t)) for t in tools
+        )
+        top_p = extra.get("top_p")
+        frequency_penalty = extra.get("frequency_penalty")
+        presence_penalty = extra.get("presence_penalty")
         cache_key = (
-            temperature,
-            max_tokens,
-            len(tools),
-            extra.get("top_p"),
-            extra.get("frequency_penalty"),
-            extra.get("presence_penalty"),
+            float(temperature),
+            int(max_tokens),
+            tools_key,
+            None if top_p is None else float(top_p),
+            None if frequency_penalty is None else float(frequency_penalty),
+            None if presence_penalty is None else float(presence_penalty),
         )
 
         if cache_key in self._llm_cache:
@@ -249,18 +337,17 @@ class AzureOpenAIAdapter(AzureOpenAIPort):
             _logger.info("Binding %d tools to LLM", len(tools))
             llm = llm.bind_tools(tools)
 
-        if len(self._llm_cache) >= 10:
-            oldest_key = next(iter(self._llm_cache))
-            del self._llm_cache[oldest_key]
-            _logger.debug("LLM cache full, removed oldest config: %s", oldest_key)
-
         self._llm_cache[cache_key] = llm
         return llm
 
+    # _build_llm only constructs the SDK client — no network call that
+    # could legitimately be rate limited — so the old 1s→20s, 5-attempt
+    # schedule just stretched a cold path that should fail fast. A short
+    # jittered schedule keeps the guard without the stall.
     @retry(
         retry=retry_if_exception_type(RateLimitError),
-        wait=wait_exponential_jitter(initial=1, max=20),
-        stop=stop_after_attempt(5),
+        wait=wait_exponential_jitter(initial=0.1, max=2.0),
+        stop=stop_after_attempt(3),
         after=_log_retry,
         reraise=True,
     )
@@ -278,6 +365,7 @@ class AzureOpenAIAdapter(AzureOpenAIPort):
         if "presence_penalty" in extra:
             model_kwargs["presence_penalty"] = float(extra["presence_penalty"])
 
+        http_client, http_async_client = self._get_http_clients()
         return AzureChatOpenAI(
             azure_endpoint=self._endpoint,
             deployment_name=self._deployment,
@@ -288,6 +376,8 @@ class AzureOpenAIAdapter(AzureOpenAIPort):
             model_kwargs=model_kwargs,
             timeout=self._default_timeout,
             streaming=True,
+            http_client=http_client,
+            http_async_client=http_async_client,
         )
 
     @staticmethod
@@ -2,6 +2,7 @@
 
 import logging
 from typing import Any, Dict, List, Optional
+import orjson
 import requests
 from requests.exceptions import RequestException
 
@@ -21,6 +22,7 @@ class CanvasRepository:
         """
         self.base_url = base_url.rstrip("/")
         self.api_base = f"{self.base_url}/api/v1"
+        self.graphql_url = f"{self.base_url}/api/graphql"
         self.access_token = access_token
         self._session = requests.Session()
         self._session.headers.update(
@@ -58,12 +60,209 @@ class CanvasRepository:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
             response.raise_for_status()
-            return response.json()
+            # orjson parses the raw bytes directly (no str decode round-trip)
+            # and is several times faster than stdlib json on Canvas payloads.
+            return orjson.loads(response.content)
 
         except RequestException as e:
             _logger.error("Canvas API error: %s", str(e))
             raise
 
+    def _call_graphql(
+        self, query: str, variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make a Canvas GraphQL request.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            The ``data`` portion of the GraphQL response
+
+        Raises:
+            RequestException: If the call fails or the response carries errors
+        """
+        try:
+            response = self._session.post(
+                self.graphql_url,
+                data=orjson.dumps({"query": query, "variables": variables or {}}),
+                timeout=30,
+            )
+            response.raise_for_status()
+            payload = orjson.loads(response.content)
+
+            if payload.get("errors"):
+                raise RequestException(f"Canvas GraphQL errors: {payload['errors']}")
+
+            return payload.get("data", {})
+
+        except RequestException as e:
+            _logger.error("Canvas GraphQL error: %s", str(e))
+            raise
+
+    # GraphQL field names are camelCase; the tools and formatters expect
+    # the REST API's snake_case keys, so nodes are remapped on the way out.
+    _ALL_ASSIGNMENTS_QUERY = """
+        query AllAssignments($searchTerm: String) {
+          allCourses {
+            _id
+            name
+            assignmentsConnection(filter: {searchTerm: $searchTerm}) {
+              nodes {
+                _id
+                name
+                description
+                dueAt
+                unlockAt
+                lockAt
+                pointsPossible
+                htmlUrl
+                submissionTypes
+                peerReviews {
+                  enabled
+                  count
+                  automaticReviews
+                }
+              }
+            }
+          }
+        }
+    """
+
+    def get_assignments_across_courses(
+        self,
+        course_ids: Optional[List[int]] = None,
+        include: Optional[List[str]] = None,
+        bucket: Optional[str] = None,
+        search_term: Optional[str] = None,
+    ) -> Optional[Dict[int, List[Dict[str, Any]]]]:
+        """Fetch assignments for all courses in a single GraphQL round-trip.
+
+        Replaces the N-request REST fan-out for the "all courses" path.
+        Returns a mapping of course_id -> assignment list (REST-shaped
+        dicts), or ``None`` when the batch path can't serve the request —
+        GraphQL has no ``bucket`` or submission ``include`` equivalent, and
+        any transport failure also returns ``None`` — so callers can fall
+        back to the per-course REST loop.
+
+        Args:
+            course_ids: Optional allow-list of course IDs to keep
+            include: Additional data to include (unsupported here)
+            bucket: Status filter (unsupported here)
+            search_term: Partial title to match
+        """
+        if include or bucket:
+            return None
+
+        try:
+            data = self._call_graphql(
+                self._ALL_ASSIGNMENTS_QUERY, {"searchTerm": search_term}
+            )
+        except RequestException:
+            return None
+
+        wanted = set(course_ids) if course_ids is not None else None
+        results: Dict[int, List[Dict[str, Any]]] = {}
+
+        for course in data.get("allCourses") or []:
+            try:
+                course_id = int(course["_id"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if wanted is not None and course_id not in wanted:
+                continue
+
+            assignments = []
+            nodes = (course.get("assignmentsConnection") or {}).get("nodes") or []
+            for node in nodes:
+                peer = node.get("peerReviews") or {}
+                assignments.append(
+                    {
+                        "id": int(node["_id"]) if node.get("_id") else None,
+                        "name": node.get("name"),
+                        "description": node.get("description"),
+                        "due_at": node.get("dueAt"),
+                        "unlock_at": node.get("unlockAt"),
+                        "lock_at": node.get("lockAt"),
+                        "points_possible": node.get("pointsPossible"),
+                        "html_url": node.get("htmlUrl"),
+                        "submission_types": node.get("submissionTypes") or [],
+                        "peer_reviews": peer.get("enabled", False),
+                        "peer_review_count": peer.get("count"),
+                        "automatic_peer_reviews": peer.get("automaticReviews", False),
+                    }
+                )
+            results[course_id] = assignments
+
+        _logger.info(
+            "Fetched assignments for %d courses in one GraphQL call", len(results)
+        )
+        return results
+
+    _COURSE_ASSIGNMENTS_WITH_SUBMISSION_QUERY = """
+        query AssignmentsWithSubmission($courseId: ID!) {
+          course(id: $courseId) {
+            assignmentsConnection {
+              nodes {
+                _id
+                name
+                pointsPossible
+                submissionsConnection {
+                  nodes {
+                    score
+                  }
+                }
+              }
+            }
+          }
+        }
+    """
+
+    def graphql_assignments_with_submission(
+        self, course_id: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch a course's assignments plus the viewer's scores in one call.
+
+        The REST equivalent (``get_assignments`` with
+        ``include=["submission"]``) hydrates submissions server-side page by
+        page; the GraphQL query returns everything in a single round-trip.
+        As a student, ``submissionsConnection`` only ever contains the
+        viewer's own submission.
+
+        Args:
+            course_id: Canvas course ID
+
+        Returns:
+            REST-shaped assignment dicts (each with a ``submission`` key),
+            or ``None`` on failure so callers can fall back to REST.
+        """
+        try:
+            data = self._call_graphql(
+                self._COURSE_ASSIGNMENTS_WITH_SUBMISSION_QUERY,
+                {"courseId": course_id},
+            )
+        except RequestException:
+            return None
+
+        course = data.get("course")
+        if not course:
+            return None
+
+        assignments = []
+        nodes = (course.get("assignmentsConnection") or {}).get("nodes") or []
+        for node in nodes:
+            subs = (node.get("submissionsConnection") or {}).get("nodes") or []
+            assignments.append(
+                {
+                    "id": int(node["_id"]) if node.get("_id") else None,
+                    "name": node.get("name"),
+                    "points_possible": node.get("pointsPossible") or 0,
+                    "submission": subs[0] if subs else None,
+                }
+            )
+        return assignments
+
     def get_courses(self) -> List[Dict[str, Any]]:
         """Get all courses for the user (active and concluded).
 